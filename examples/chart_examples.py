@@ -23,37 +23,36 @@ async def demonstrate_chart_features():
     print("=" * 50)
     
     # Initialize the chart collector
-    chart_collector = ChartImageCollector()
-    
-    # Example symbols to analyze
-    symbols = ["GME", "TSLA", "AMC", "NVDA"]
-    
-    for symbol in symbols:
-        print(f"\n📊 Charts for {symbol}")
-        print("-" * 30)
-        
-        # 1. Basic technical chart
-        print("📈 Technical Analysis Chart:")
-        technical_chart = await chart_collector.get_technical_chart(symbol)
-        print(f"   {technical_chart}")
-        
-        # 2. Pattern analysis chart
-        print("🔍 Pattern Analysis Chart:")
-        pattern_chart = await chart_collector.get_pattern_analysis_chart(symbol)
-        print(f"   {pattern_chart}")
-        
-        # 3. Short squeeze analysis chart
-        print("🎯 Short Squeeze Analysis Chart:")
-        squeeze_chart = await chart_collector.get_squeeze_analysis_chart(symbol)
-        print(f"   {squeeze_chart}")
-        
-        # 4. Multiple timeframes
-        print("⏰ Multiple Timeframes:")
-        timeframe_charts = await chart_collector.get_multiple_timeframes(symbol)
-        for timeframe, url in timeframe_charts.items():
-            print(f"   {timeframe:12}: {url}")
-        
-        print()  # Add space between symbols
+    async with ChartImageCollector() as chart_collector:
+        # Example symbols to analyze
+        symbols = ["GME", "TSLA", "AMC", "NVDA"]
+        
+        for symbol in symbols:
+            print(f"\n📊 Charts for {symbol}")
+            print("-" * 30)
+            
+            # 1. Basic technical chart
+            print("📈 Technical Analysis Chart:")
+            technical_chart = await chart_collector.get_technical_chart(symbol)
+            print(f"   {technical_chart}")
+            
+            # 2. Pattern analysis chart
+            print("🔍 Pattern Analysis Chart:")
+            pattern_chart = await chart_collector.get_pattern_analysis_chart(symbol)
+            print(f"   {pattern_chart}")
+            
+            # 3. Short squeeze analysis chart
+            print("🎯 Short Squeeze Analysis Chart:")
+            squeeze_chart = await chart_collector.get_squeeze_analysis_chart(symbol)
+            print(f"   {squeeze_chart}")
+            
+            # 4. Multiple timeframes
+            print("⏰ Multiple Timeframes:")
+            timeframe_charts = await chart_collector.get_multiple_timeframes(symbol)
+            for timeframe, url in timeframe_charts.items():
+                print(f"   {timeframe:12}: {url}")
+            
+            print()  # Add space between symbols
 
 
 async def demonstrate_alert_charts():
@@ -62,21 +61,21 @@ async def demonstrate_alert_charts():
     print("\n🚨 Alert-Specific Charts")
     print("=" * 30)
     
-    chart_collector = ChartImageCollector()
-    symbol = "GME"
-    
-    alert_types = [
-        "short_squeeze",
-        "momentum", 
-        "breakout",
-        "value",
-        "divergence"
-    ]
-    
-    for alert_type in alert_types:
-        print(f"📊 {alert_type.upper()} Alert Chart:")
-        alert_chart = await chart_collector.get_alert_chart(symbol, alert_type)
-        print(f"   {alert_chart}")
+    async with ChartImageCollector() as chart_collector:
+        symbol = "GME"
+        
+        alert_types = [
+            "short_squeeze",
+            "momentum", 
+            "breakout",
+            "value",
+            "divergence"
+        ]
+        
+        for alert_type in alert_types:
+            print(f"📊 {alert_type.upper()} Alert Chart:")
+            alert_chart = await chart_collector.get_alert_chart(symbol, alert_type)
+            print(f"   {alert_chart}")
 
 
 async def demonstrate_comprehensive_package():
@@ -85,16 +84,16 @@ async def demonstrate_comprehensive_package():
     print("\n📦 Comprehensive Chart Package")
     print("=" * 40)
     
-    chart_collector = ChartImageCollector()
-    symbol = "TSLA"
-    
-    print(f"🔄 Generating comprehensive chart package for {symbol}...")
-    
-    charts = await chart_collector.get_comprehensive_chart_package(symbol)
-    
-    print(f"\n✅ Generated {len(charts)} charts:")
-    for chart_type, url in charts.items():
-        print(f"   {chart_type:20}: {url}")
+    async with ChartImageCollector() as chart_collector:
+        symbol = "TSLA"
+        
+        print(f"🔄 Generating comprehensive chart package for {symbol}...")
+        
+        charts = await chart_collector.get_comprehensive_chart_package(symbol)
+        
+        print(f"\n✅ Generated {len(charts)} charts:")
+        for chart_type, url in charts.items():
+            print(f"   {chart_type:20}: {url}")
 
 
 async def demonstrate_backup_options():
@@ -103,20 +102,20 @@ async def demonstrate_backup_options():
     print("\n🔄 Backup Chart Options")
     print("=" * 30)
     
-    chart_collector = ChartImageCollector()
-    symbol = "AAPL"
-    
-    print(f"📊 Primary Chart (chart-img.com):")
-    primary_chart = await chart_collector.get_technical_chart(symbol)
-    print(f"   {primary_chart}")
-    
-    print(f"🔄 TradingView Backup:")
-    tradingview_backup = chart_collector.get_tradingview_backup_url(symbol)
-    print(f"   {tradingview_backup}")
-    
-    print(f"📈 Yahoo Finance Backup:")
-    yahoo_backup = chart_collector.get_yahoo_backup_url(symbol)
-    print(f"   {yahoo_backup}")
+    async with ChartImageCollector() as chart_collector:
+        symbol = "AAPL"
+        
+        print(f"📊 Primary Chart (chart-img.com):")
+        primary_chart = await chart_collector.get_technical_chart(symbol)
+        print(f"   {primary_chart}")
+        
+        print(f"🔄 TradingView Backup:")
+        tradingview_backup = chart_collector.get_tradingview_backup_url(symbol)
+        print(f"   {tradingview_backup}")
+        
+        print(f"📈 Yahoo Finance Backup:")
+        yahoo_backup = chart_collector.get_yahoo_backup_url(symbol)
+        print(f"   {yahoo_backup}")
 
 
 async def demonstrate_chart_validation():
@@ -125,18 +124,18 @@ async def demonstrate_chart_validation():
     print("\n✅ Chart Availability Validation")
     print("=" * 40)
     
-    chart_collector = ChartImageCollector()
-    symbols = ["TSLA", "INVALID_SYMBOL"]
-    
-    for symbol in symbols:
-        print(f"\n🔍 Validating charts for {symbol}:")
-        
-        validation = await chart_collector.validate_chart_availability(symbol)
+    async with ChartImageCollector() as chart_collector:
+        symbols = ["TSLA", "INVALID_SYMBOL"]
         
-        print(f"   Available: {validation['charts_available']}")
-        print(f"   Chart URL: {validation.get('chart_url', 'N/A')}")
-        print(f"   TradingView: {validation['backup_tradingview']}")
-        print(f"   Yahoo: {validation['backup_yahoo']}")
+        for symbol in symbols:
+            print(f"\n🔍 Validating charts for {symbol}:")
+            
+            validation = await chart_collector.validate_chart_availability(symbol)
+            
+            print(f"   Available: {validation['charts_available']}")
+            print(f"   Chart URL: {validation.get('chart_url', 'N/A')}")
+            print(f"   TradingView: {validation['backup_tradingview']}")
+            print(f"   Yahoo: {validation['backup_yahoo']}")
 
 
 def generate_html_display(symbol: str, charts: dict) -> str:
@@ -213,8 +212,8 @@ async def main():
         print("\n📄 HTML Dashboard Example")
         print("=" * 30)
         
-        chart_collector = ChartImageCollector()
-        charts = await chart_collector.get_comprehensive_chart_package("GME")
+        async with ChartImageCollector() as chart_collector:
+            charts = await chart_collector.get_comprehensive_chart_package("GME")
         
         html_content = generate_html_display("GME", charts)
         
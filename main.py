@@ -10,10 +10,16 @@ import asyncio
 import argparse
 import sys
 from datetime import datetime
-from typing import List
+from typing import List, Optional
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
 
 from src.core.stock_analyzer import StockAnalyzer, WatchlistAnalyzer
 from src.core.config import settings
+from src.models.stock_data import StockAnalysis
 
 
 async def analyze_single_stock(symbol: str):
@@ -23,8 +29,33 @@ async def analyze_single_stock(symbol: str):
     print(f"\n🔍 Analyzing {symbol}...")
     print("=" * 50)
     
-    analysis = await analyzer.analyze_stock(symbol)
+    try:
+        analysis = await analyzer.analyze_stock(symbol)
+    finally:
+        await analyzer.aclose()
+    
+    print_stock_analysis(symbol, analysis)
+
+
+async def analyze_multiple_stocks(symbols: List[str]):
+    """Analyze several stocks in one run and print each result in order"""
+    analyzer = StockAnalyzer()
+    
+    print(f"\n🔍 Analyzing {', '.join(symbols)}...")
+    
+    # One event loop and one concurrency-capped run for every symbol
+    try:
+        analyses = await analyzer.analyze_multiple_stocks(symbols)
+    finally:
+        await analyzer.aclose()
     
+    for symbol in symbols:
+        print(f"\n{'=' * 50}")
+        print_stock_analysis(symbol, analyses.get(symbol))
+
+
+def print_stock_analysis(symbol: str, analysis: Optional[StockAnalysis]):
+    """Print an analysis, or a failure line when there is none"""
     if not analysis:
         print(f"❌ Failed to analyze {symbol}")
         return
@@ -179,6 +210,8 @@ async def generate_chart_examples(symbol: str):
         
     except Exception as e:
         print(f"❌ Error generating charts: {e}")
+    finally:
+        await chart_collector.aclose()
 
 
 def check_configuration():
@@ -242,6 +275,10 @@ Examples:
     
     args = parser.parse_args()
     
+    # libuv-backed event loop for every asyncio.run below (uvicorn picks it up on its own)
+    if uvloop is not None:
+        uvloop.install()
+    
     # Print header
     print("🎯 Retail Meme Stock Analyzer")
     print("=" * 50)
@@ -254,8 +291,7 @@ Examples:
         asyncio.run(analyze_single_stock(args.symbol.upper()))
     elif args.symbols:
         symbols = [s.upper() for s in args.symbols]
-        for symbol in symbols:
-            asyncio.run(analyze_single_stock(symbol))
+        asyncio.run(analyze_multiple_stocks(symbols))
     elif args.watchlist:
         asyncio.run(analyze_watchlist())
     elif args.charts:
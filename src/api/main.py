@@ -1,10 +1,11 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse, Response
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 import asyncio
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -13,11 +14,16 @@ from ..models.stock_data import StockAnalysis
 from ..core.config import settings
 from .watchlist_api import router as watchlist_router
 from ..services.enhanced_analysis_generator import EnhancedAnalysisGenerator
+from ..services.real_market_data import real_market_service
+from ..services.simple_market_data import simple_market_service
+from ..utils.http_pool import close_shared_connector
 
 app = FastAPI(
     title="Retail Meme Stock Analyzer",
     description="API for analyzing retail meme stocks using social sentiment, technical analysis, fundamentals, analyst coverage, and stock structure",
-    version="1.0.0"
+    version="1.0.0",
+    # Analysis payloads are large nested dicts; orjson serializes them several times faster
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -47,6 +53,16 @@ latest_analyses: Dict[str, StockAnalysis] = {}
 last_scan_time: Optional[datetime] = None
 
 
+@app.on_event("shutdown")
+async def close_http_sessions():
+    """Release pooled HTTP connections held by long-lived services"""
+    await real_market_service.aclose()
+    await simple_market_service.aclose()
+    await stock_analyzer.aclose()
+    await watchlist_analyzer.aclose()
+    await close_shared_connector()
+
+
 class AnalyzeRequest(BaseModel):
     symbols: List[str]
     company_names: Optional[List[str]] = None
@@ -327,15 +343,50 @@ async def generate_all_analyses(background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail=f"Error generating analyses: {str(e)}")
 
 
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values"""
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+    
+    if "gzip" in qualities:
+        return qualities["gzip"] > 0
+    return qualities.get("*", 0) > 0
+
+
 # Serve analysis page directly
 @app.get("/stock/{symbol}", response_class=HTMLResponse)
-async def get_analysis_page(symbol: str):
+async def get_analysis_page(symbol: str, request: Request):
     """Serve the analysis page for a specific stock"""
     try:
         analysis_file = f"analysis_pages/{symbol.lower()}_analysis.html"
+        
+        # Prefer the pre-compressed sibling written at generation time, unless the
+        # plain page has since been regenerated without one
+        gzip_file = f"{analysis_file}.gz"
+        if (_accepts_gzip(request.headers.get("accept-encoding", ""))
+                and os.path.exists(gzip_file)
+                and os.path.getmtime(gzip_file) >= os.path.getmtime(analysis_file)):
+            with open(gzip_file, "rb") as f:
+                content = f.read()
+            return Response(content=content, media_type="text/html",
+                            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+        
         with open(analysis_file, "r", encoding="utf-8") as f:
             content = f.read()
-        return HTMLResponse(content=content)
+        return HTMLResponse(content=content, headers={"Vary": "Accept-Encoding"})
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Analysis page for {symbol} not found. Try generating it first.")
 
@@ -9,7 +9,7 @@ from ..database.watchlist_models import (
     AssetType, AlertType, Priority, get_database_session
 )
 from ..services.watchlist_service import WatchlistService
-from ..services.simple_market_data import SimpleMarketDataService
+from ..services.simple_market_data import simple_market_service
 
 router = APIRouter(prefix="/api/watchlist", tags=["watchlist"])
 
@@ -391,8 +391,7 @@ async def refresh_market_data(background_tasks: BackgroundTasks):
     """Manually refresh market data for all watchlist tickers"""
     try:
         # Start refresh in background
-        market_data_service = SimpleMarketDataService()
-        background_tasks.add_task(market_data_service.update_all_watchlist_data)
+        background_tasks.add_task(simple_market_service.update_all_watchlist_data)
         
         return {
             "success": True,
@@ -406,8 +405,7 @@ async def refresh_market_data(background_tasks: BackgroundTasks):
 async def refresh_ticker_data(symbol: str, background_tasks: BackgroundTasks):
     """Manually refresh market data for a specific ticker"""
     try:
-        market_data_service = SimpleMarketDataService()
-        background_tasks.add_task(market_data_service.update_single_ticker, symbol.upper())
+        background_tasks.add_task(simple_market_service.update_single_ticker, symbol.upper())
         
         return {
             "success": True,
@@ -0,0 +1,183 @@
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import orjson
+
+from .config import settings
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:
+    aioredis = None
+    RedisError = None
+
+# Failures that mean Redis itself is unreachable, as opposed to a value that can't be stored
+_REDIS_ERRORS = tuple(error for error in (RedisError, OSError, asyncio.TimeoutError) if error is not None)
+
+logger = logging.getLogger(__name__)
+
+# In-process fallback: key -> (expires_at, value); oldest entries are evicted past the cap
+_MAX_LOCAL_ENTRIES = 1024
+_local: Dict[str, Tuple[float, Any]] = {}
+
+# redis.asyncio clients are bound to the loop they first connect on, and the CLI runs
+# one asyncio.run per symbol, so the client is recreated whenever the loop changes
+_redis = None
+_redis_loop: Optional[asyncio.AbstractEventLoop] = None
+_redis_failed = False
+
+
+def _get_redis():
+    """Get the Redis client for the running loop, or None when Redis isn't in use"""
+    global _redis, _redis_loop
+    if aioredis is None or _redis_failed or settings.market_data_cache_backend != "redis":
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _redis is None or _redis_loop is not loop:
+        _redis = aioredis.from_url(settings.redis_url)
+        _redis_loop = loop
+    return _redis
+
+
+def _disable_redis(error: Exception):
+    """Stop using Redis for the rest of the process after a connection failure"""
+    global _redis_failed
+    if not _redis_failed:
+        logger.warning("Redis cache unavailable, using in-process cache: %s", error)
+    _redis_failed = True
+
+
+async def cache_get(key: str, decode: Optional[Callable[[Any], Any]] = None,
+                    shared: bool = True) -> Any:
+    """Get a cached value, or None on a miss
+
+    Values read back from Redis are JSON; decode rebuilds richer types from it.
+    shared=False reads only the in-process cache.
+    """
+    client = _get_redis() if shared else None
+    if client is not None:
+        try:
+            raw = await client.get(key)
+        except _REDIS_ERRORS as e:
+            _disable_redis(e)
+        else:
+            if raw is None:
+                return None
+            try:
+                value = orjson.loads(raw)
+                return decode(value) if decode is not None else value
+            except Exception as e:
+                # A stale or foreign entry is a miss, not a Redis outage
+                logger.debug("Ignoring undecodable cache entry %s: %s", key, e)
+                return None
+
+    entry = _local.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[0]:
+        _local.pop(key, None)
+        return None
+    return entry[1]
+
+
+async def cache_set(key: str, value: Any, ttl: int, shared: bool = True):
+    """Cache a value for ttl seconds; shared=False keeps it out of Redis"""
+    client = _get_redis() if shared else None
+    if client is not None:
+        try:
+            # JSON rather than pickle, so whoever can write to Redis can't run code here
+            payload = orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError as e:
+            logger.debug("Not caching %s, value isn't JSON-serializable: %s", key, e)
+            return
+        try:
+            await client.setex(key, ttl, payload)
+            return
+        except _REDIS_ERRORS as e:
+            _disable_redis(e)
+
+    if len(_local) >= _MAX_LOCAL_ENTRIES:
+        _local.pop(next(iter(_local)))
+    _local[key] = (time.monotonic() + ttl, value)
+
+
+class InFlight:
+    """Share one running computation among concurrent callers asking for the same key"""
+
+    def __init__(self):
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the computation already running for key, or start it with compute()"""
+        future = self._futures.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved so an unawaited future doesn't log
+            raise
+        finally:
+            self._futures.pop(key, None)
+
+        future.set_result(result)
+        return result
+
+
+_inflight = InFlight()
+
+
+def async_cached(ttl: int, decode: Optional[Callable[[Any], Any]] = None,
+                 shared: bool = True) -> Callable:
+    """Cache an async function's non-None results for ttl seconds
+
+    The key is the function's qualified name plus its arguments as JSON, leaving
+    out `self` on methods, so instances share entries. Values are stored in Redis
+    as JSON when it is the configured backend, with decode rebuilding them on a
+    hit; otherwise they are kept in process. shared=False always keeps them in
+    process, for values that must not leave it, such as URLs carrying API keys.
+    Callers that miss while the same call is already running share its result.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(func)
+        skip_self = next(iter(signature.parameters), None) == "self"
+        prefix = f"cache:{func.__module__}.{func.__qualname__}:"
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            if skip_self:
+                arguments.pop("self")
+            key = prefix + orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS, default=str).decode()
+
+            cached = await cache_get(key, decode, shared)
+            if cached is not None:
+                return cached
+
+            async def compute():
+                result = await func(*args, **kwargs)
+                if result is not None:
+                    await cache_set(key, result, ttl, shared)
+                return result
+
+            # Concurrent misses for the same key wait on a single call
+            return await _inflight.run(key, compute)
+
+        return wrapper
+
+    return decorator
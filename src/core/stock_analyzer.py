@@ -11,8 +11,15 @@ from ..data_collectors.stock_structure_collector import StockStructureCollector
 from ..analyzers.composite_scorer import CompositeScorer
 from ..analyzers.divergence_detector import DivergenceDetector
 from ..utils.rate_limiter import global_rate_limiter
+from .cache import async_cached
 from .config import settings
 
+# A full analysis is expensive; repeat requests for a symbol reuse it for a few minutes
+_ANALYSIS_CACHE_TTL = 300
+# Analyses embed chart URLs, which carry the chart-img API key when one is configured;
+# only keyless analyses go to the shared Redis cache
+_SHARE_ANALYSES = not settings.chart_img_api_key
+
 
 class StockAnalyzer:
     def __init__(self):
@@ -27,6 +34,11 @@ class StockAnalyzer:
         self.scorer = CompositeScorer()
         self.divergence_detector = DivergenceDetector()
     
+    async def aclose(self):
+        """Release HTTP sessions held by the data collectors"""
+        await self.technical_collector.aclose()
+    
+    @async_cached(ttl=_ANALYSIS_CACHE_TTL, decode=StockAnalysis.from_dict, shared=_SHARE_ANALYSES)
     async def analyze_stock(self, symbol: str, company_name: str = "") -> Optional[StockAnalysis]:
         """Perform comprehensive analysis of a single stock"""
         try:
@@ -96,7 +108,7 @@ class StockAnalyzer:
             divergence_signals = self.divergence_detector.detect_all_divergences(analysis)
             
             # Convert divergence signals to alerts
-            alerts = self._convert_signals_to_alerts(symbol, divergence_signals, composite_score.total_score)
+            alerts = await self._convert_signals_to_alerts(symbol, divergence_signals, composite_score.total_score)
             analysis.alerts = alerts
             
             print(f"Analysis complete for {symbol}. Score: {composite_score.total_score:.1f}")
@@ -236,46 +248,45 @@ class StockAnalyzer:
             timestamp=datetime.now()
         )
     
-    def _convert_signals_to_alerts(self, symbol: str, signals, total_score: float) -> List[StockAlert]:
+    async def _convert_signals_to_alerts(self, symbol: str, signals, total_score: float) -> List[StockAlert]:
         """Convert divergence signals to stock alerts"""
         alerts = []
         
         # Import chart collector here to avoid circular imports
         from ..data_collectors.chart_image_collector import ChartImageCollector
-        chart_collector = ChartImageCollector()
-        
-        for signal in signals:
-            # Determine priority based on signal strength and total score
-            if signal.strength > 0.8 and total_score > 70:
-                priority = "high"
-            elif signal.strength > 0.6 and total_score > 50:
-                priority = "medium"
-            else:
-                priority = "low"
-            
-            # Get alert-specific chart image
-            try:
-                chart_image_url = asyncio.run(chart_collector.get_alert_chart(symbol, signal.divergence_type.value))
-            except:
-                chart_image_url = f"https://chart-img.com/chart/{symbol.upper()}"
-            
-            # Create alert
-            alert = StockAlert(
-                symbol=symbol,
-                alert_type=signal.divergence_type.value,
-                score=total_score,
-                trigger_reason=signal.description,
-                priority=priority,
-                social_catalyst=signal.catalyst if "social" in signal.catalyst.lower() else None,
-                technical_catalyst=signal.catalyst if "technical" in signal.catalyst.lower() else None,
-                fundamental_catalyst=signal.catalyst if "fundamental" in signal.catalyst.lower() else None,
-                analyst_catalyst=signal.catalyst if "analyst" in signal.catalyst.lower() else None,
-                structure_catalyst=signal.catalyst if "short" in signal.catalyst.lower() else None,
-                timestamp=datetime.now(),
-                chart_image_url=chart_image_url
-            )
-            
-            alerts.append(alert)
+        async with ChartImageCollector() as chart_collector:
+            for signal in signals:
+                # Determine priority based on signal strength and total score
+                if signal.strength > 0.8 and total_score > 70:
+                    priority = "high"
+                elif signal.strength > 0.6 and total_score > 50:
+                    priority = "medium"
+                else:
+                    priority = "low"
+                
+                # Get alert-specific chart image
+                try:
+                    chart_image_url = await chart_collector.get_alert_chart(symbol, signal.divergence_type.value)
+                except Exception:
+                    chart_image_url = f"https://chart-img.com/chart/{symbol.upper()}"
+                
+                # Create alert
+                alert = StockAlert(
+                    symbol=symbol,
+                    alert_type=signal.divergence_type.value,
+                    score=total_score,
+                    trigger_reason=signal.description,
+                    priority=priority,
+                    social_catalyst=signal.catalyst if "social" in signal.catalyst.lower() else None,
+                    technical_catalyst=signal.catalyst if "technical" in signal.catalyst.lower() else None,
+                    fundamental_catalyst=signal.catalyst if "fundamental" in signal.catalyst.lower() else None,
+                    analyst_catalyst=signal.catalyst if "analyst" in signal.catalyst.lower() else None,
+                    structure_catalyst=signal.catalyst if "short" in signal.catalyst.lower() else None,
+                    timestamp=datetime.now(),
+                    chart_image_url=chart_image_url
+                )
+                
+                alerts.append(alert)
         
         return alerts
 
@@ -284,6 +295,10 @@ class WatchlistAnalyzer:
     def __init__(self):
         self.analyzer = StockAnalyzer()
     
+    async def aclose(self):
+        """Release HTTP sessions held by the underlying analyzer"""
+        await self.analyzer.aclose()
+    
     async def analyze_watchlist(self, symbols: List[str] = None) -> Dict[str, Optional[StockAnalysis]]:
         """Analyze the entire watchlist"""
         if symbols is None:
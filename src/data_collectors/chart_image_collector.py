@@ -4,15 +4,50 @@ from datetime import datetime
 from typing import Dict, Optional, List
 from urllib.parse import urlencode
 
+from ..core.cache import InFlight, async_cached
 from ..core.config import settings
 from ..utils.rate_limiter import RateLimiter
 
 
+# Chart URLs only depend on their arguments. They carry the chart-img API key,
+# so they stay in process rather than in the shared Redis cache
+_CHART_CACHE_TTL = 3600
+# Concurrent package requests for a symbol share one build
+_package_builds = InFlight()
+
+
 class ChartImageCollector:
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = "https://chart-img.com/chart"
         self.api_key = getattr(settings, 'chart_img_api_key', None)
         self.rate_limiter = RateLimiter(requests_per_minute=60)  # Conservative limit
+        # Caps concurrent HEAD checks in validate_chart_availability, the only network I/O here
+        self._semaphore = asyncio.Semaphore(5)
+        # An injected session belongs to the caller; one created here is closed by aclose()
+        self.session = session
+        self._owns_session = False
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, creating one on first use if none was injected"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=10, keepalive_timeout=60)
+            )
+            self._owns_session = True
+        return self.session
+    
+    async def aclose(self):
+        """Close the session if this collector created it"""
+        if self._owns_session and self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._owns_session = False
+    
+    async def __aenter__(self) -> "ChartImageCollector":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
     
     async def get_chart_image(self, symbol: str, timeframe: str = "daily", 
                             indicators: List[str] = None, width: int = 800, 
@@ -49,6 +84,7 @@ class ChartImageCollector:
             # Return a fallback URL
             return f"{self.base_url}/{symbol.upper()}"
     
+    @async_cached(ttl=_CHART_CACHE_TTL, shared=False)
     async def get_technical_chart(self, symbol: str, timeframe: str = "daily") -> str:
         """Get chart with common technical indicators"""
         indicators = [
@@ -62,6 +98,7 @@ class ChartImageCollector:
             height=700
         )
     
+    @async_cached(ttl=_CHART_CACHE_TTL, shared=False)
     async def get_multiple_timeframes(self, symbol: str) -> Dict[str, str]:
         """Get charts for multiple timeframes"""
         timeframes = {
@@ -72,14 +109,19 @@ class ChartImageCollector:
             "monthly": "monthly"
         }
         
+        # Concurrent; the rate limiter in get_chart_image paces the requests
+        results = await asyncio.gather(
+            *(self.get_technical_chart(symbol, timeframe) for timeframe in timeframes.values()),
+            return_exceptions=True
+        )
+        
         charts = {}
-        for name, timeframe in timeframes.items():
-            try:
-                charts[name] = await self.get_technical_chart(symbol, timeframe)
-                await asyncio.sleep(0.1)  # Small delay between requests
-            except Exception as e:
-                print(f"Error getting {timeframe} chart for {symbol}: {e}")
+        for (name, timeframe), result in zip(timeframes.items(), results):
+            if isinstance(result, Exception):
+                print(f"Error getting {timeframe} chart for {symbol}: {result}")
                 charts[name] = f"{self.base_url}/{symbol.upper()}"
+            else:
+                charts[name] = result
         
         return charts
     
@@ -124,6 +166,12 @@ class ChartImageCollector:
     
     async def get_comprehensive_chart_package(self, symbol: str) -> Dict[str, str]:
         """Get a comprehensive package of charts for analysis"""
+        return await _package_builds.run(
+            symbol.upper(), lambda: self._build_comprehensive_chart_package(symbol)
+        )
+    
+    async def _build_comprehensive_chart_package(self, symbol: str) -> Dict[str, str]:
+        """Generate every chart in the comprehensive package"""
         try:
             # Run chart generation concurrently
             tasks = {
@@ -135,17 +183,16 @@ class ChartImageCollector:
                 "social_sentiment": self.get_social_sentiment_chart(symbol)
             }
             
-            # Execute all tasks concurrently
+            # Execute all tasks concurrently; the rate limiter paces the requests
+            outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+            
             results = {}
-            for name, task in tasks.items():
-                try:
-                    results[name] = await task
-                except Exception as e:
-                    print(f"Error generating {name} chart for {symbol}: {e}")
+            for name, outcome in zip(tasks, outcomes):
+                if isinstance(outcome, Exception):
+                    print(f"Error generating {name} chart for {symbol}: {outcome}")
                     results[name] = f"{self.base_url}/{symbol.upper()}"
-                
-                # Small delay to be respectful to the API
-                await asyncio.sleep(0.2)
+                else:
+                    results[name] = outcome
             
             return results
             
@@ -162,6 +209,7 @@ class ChartImageCollector:
                 "social_sentiment": f"{self.base_url}/{symbol.upper()}"
             }
     
+    @async_cached(ttl=_CHART_CACHE_TTL, shared=False)
     async def get_alert_chart(self, symbol: str, alert_type: str) -> str:
         """Get chart optimized for specific alert type"""
         chart_configs = {
@@ -216,12 +264,8 @@ class ChartImageCollector:
             
             # In a real implementation, you might want to make an HTTP request
             # to verify the chart actually exists
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.head(chart_url, timeout=5) as response:
-                        chart_available = response.status == 200
-                except:
-                    chart_available = False
+            async with self._semaphore:
+                chart_available = await self._head_ok(await self._get_session(), chart_url)
             
             return {
                 "charts_available": chart_available,
@@ -237,4 +281,13 @@ class ChartImageCollector:
                 "chart_url": None,
                 "backup_tradingview": self.get_tradingview_backup_url(symbol),
                 "backup_yahoo": self.get_yahoo_backup_url(symbol)
-            }
\ No newline at end of file
+            }
+    
+    @staticmethod
+    async def _head_ok(session: aiohttp.ClientSession, url: str) -> bool:
+        """Whether a HEAD request for url returns 200"""
+        try:
+            async with session.head(url, timeout=5) as response:
+                return response.status == 200
+        except:
+            return False
\ No newline at end of file
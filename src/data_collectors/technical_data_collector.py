@@ -278,8 +278,8 @@ class TechnicalAnalyzer:
             current_volume = df['volume'].iloc[-1]
             avg_volume = df['volume'].tail(20).mean()
             
-            # Volume spike if current volume is 2x average
-            return current_volume > (avg_volume * 2)
+            # Volume spike if current volume is 2x average; a plain bool, not numpy.bool_
+            return bool(current_volume > (avg_volume * 2))
         except:
             return False
     
@@ -442,6 +442,10 @@ class TechnicalDataCollector:
         from .chart_image_collector import ChartImageCollector
         self.chart_collector = ChartImageCollector()
     
+    async def aclose(self):
+        """Release the chart collector's HTTP session"""
+        await self.chart_collector.aclose()
+    
     async def collect_technical_analysis(self, symbol: str) -> TechnicalAnalysis:
         """Collect comprehensive technical analysis for a symbol"""
         try:
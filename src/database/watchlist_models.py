@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Float, Text, Index, Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
+from contextlib import contextmanager
 from datetime import datetime
 import enum
 from typing import Optional, List, Dict, Any
@@ -75,6 +76,27 @@ class WatchlistTicker(Base):
     max_price_since_added = Column(Float)
     min_price_since_added = Column(Float)
     
+    __table_args__ = (
+        # Backs the near-entry-target count in the watchlist summary
+        Index(
+            'ix_watchlist_active_entry_target', 'is_active', 'entry_price_target',
+            postgresql_where=(is_active == True) & entry_price_target.isnot(None),
+            sqlite_where=(is_active == True) & entry_price_target.isnot(None)
+        ),
+        # Active-only lookups by symbol (get_ticker, batch refreshes)
+        Index(
+            'ix_watchlist_active_symbol', 'symbol',
+            postgresql_where=(is_active == True),
+            sqlite_where=(is_active == True)
+        ),
+        # Matches get_all_tickers' ORDER BY over active tickers
+        Index(
+            'ix_watchlist_active_priority', priority.desc(), date_added.desc(),
+            postgresql_where=(is_active == True),
+            sqlite_where=(is_active == True)
+        ),
+    )
+    
     def __repr__(self):
         return f"<WatchlistTicker(symbol='{self.symbol}', priority='{self.priority.value}', active={self.is_active})>"
     
@@ -131,6 +153,15 @@ class WatchlistAlert(Base):
     message = Column(Text)  # Custom alert message
     priority = Column(SQLEnum(Priority), nullable=False, default=Priority.MEDIUM)
     
+    __table_args__ = (
+        # Active alerts per ticker (alert checks, remove_alert's remaining count)
+        Index(
+            'ix_alerts_ticker_active', 'ticker_id',
+            postgresql_where=(is_active == True),
+            sqlite_where=(is_active == True)
+        ),
+    )
+    
     def __repr__(self):
         return f"<WatchlistAlert(symbol='{self.symbol}', type='{self.alert_type.value}', value={self.alert_value})>"
     
@@ -196,6 +227,10 @@ class WatchlistDatabase:
     def create_tables(self):
         """Create all tables"""
         Base.metadata.create_all(bind=self.engine)
+        # create_all skips indexes on tables that already exist, so add any missing ones
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
         
     def get_session(self):
         """Get database session"""
@@ -219,4 +254,18 @@ def get_database_session(database_url: str = "sqlite:///watchlist.db"):
     try:
         yield session
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+@contextmanager
+def get_db_session(database_url: str = "sqlite:///watchlist.db"):
+    """Get a database session as a context manager - use this outside FastAPI dependencies"""
+    db = WatchlistDatabase(database_url)
+    session = db.get_session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
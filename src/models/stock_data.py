@@ -1,6 +1,6 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List, Union, get_args, get_origin, get_type_hints
 from enum import Enum
 
 
@@ -123,6 +123,37 @@ class StockAlert:
     chart_image_url: Optional[str] = None
 
 
+def _from_jsonable(tp: Any, value: Any) -> Any:
+    """Rebuild a value of type tp from its JSON form (nested dataclasses, enums, datetimes)
+    
+    Only Optional[X] unions are supported; JSON can't say which member of a wider
+    union a value was, so those raise TypeError.
+    """
+    if value is None:
+        return None
+    origin = get_origin(tp)
+    if origin is Union:
+        members = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(members) != 1:
+            raise TypeError(f"Can't rebuild {tp} from JSON: only Optional[X] unions are supported")
+        tp = members[0]
+        origin = get_origin(tp)
+    if origin is list:
+        args = get_args(tp)
+        return [_from_jsonable(args[0], item) for item in value] if args else value
+    if origin is dict:
+        args = get_args(tp)
+        return {key: _from_jsonable(args[1], item) for key, item in value.items()} if args else value
+    if is_dataclass(tp):
+        hints = get_type_hints(tp)
+        return tp(**{f.name: _from_jsonable(hints[f.name], value[f.name]) for f in fields(tp) if f.name in value})
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return tp(value)
+    if tp is datetime:
+        return datetime.fromisoformat(value)
+    return value
+
+
 @dataclass
 class StockAnalysis:
     symbol: str
@@ -138,6 +169,11 @@ class StockAnalysis:
     alerts: List[StockAlert] = field(default_factory=list)
     last_updated: datetime = field(default_factory=datetime.now)
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StockAnalysis":
+        """Rebuild an analysis from its JSON form, e.g. orjson.loads(orjson.dumps(analysis))"""
+        return _from_jsonable(cls, data)
+    
     def get_divergence_signals(self) -> Dict[str, str]:
         """Detect retail vs institutional sentiment divergence"""
         divergences = {}
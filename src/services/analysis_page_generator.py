@@ -581,15 +581,12 @@ class AnalysisPageGenerator:
             
             logger.info(f"Generating analysis pages for {len(tickers)} tickers")
             
-            for ticker in tickers:
-                filepath = await self.generate_analysis_page(ticker.symbol, ticker.asset_type)
-                if filepath:
-                    results[ticker.symbol] = filepath
-                else:
-                    results[ticker.symbol] = None
-                
-                # Small delay between generations
-                await asyncio.sleep(1)
+            # Submitted together so the analyses are batched; analyze_multiple_stocks caps concurrency
+            filepaths = await asyncio.gather(
+                *(self.generate_analysis_page(ticker.symbol, ticker.asset_type) for ticker in tickers)
+            )
+            for ticker, filepath in zip(tickers, filepaths):
+                results[ticker.symbol] = filepath
             
             db_session.close()
             
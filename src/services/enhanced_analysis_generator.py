@@ -1,18 +1,36 @@
 import os
+import gzip
+import math
 import asyncio
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional, Any
 import logging
 from pathlib import Path
 
 from ..core.stock_analyzer import StockAnalyzer
 from ..services.watchlist_service import WatchlistService
-from ..database.watchlist_models import get_database_session, AssetType
+from ..database.watchlist_models import get_db_session, AssetType
 from ..services.real_market_data import real_market_service
 from ..services.company_specific_metrics import company_metrics_analyzer
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=512)
+def _score_bar_cached(label: str, score: float) -> str:
+    """Render a score bar; labels and one-decimal scores are low-cardinality"""
+    score_class = 'score-high' if score >= 70 else 'score-medium' if score >= 40 else 'score-low'
+    return f"""
+        <div style="margin-bottom: 20px;">
+            <div style="display: flex; justify-content: space-between; margin-bottom: 4px;">
+                <span>{label}</span>
+                <span>{score:.1f}/100</span>
+            </div>
+            <div class="score-bar">
+                <div class="score-fill {score_class}" style="width: {score}%;"></div>
+            </div>
+        </div>"""
+
 class EnhancedAnalysisGenerator:
     """Generate comprehensive analysis HTML pages with full technical detail"""
     
@@ -21,16 +39,16 @@ class EnhancedAnalysisGenerator:
         self.output_dir = Path("analysis_pages")
         self.output_dir.mkdir(exist_ok=True)
         
-    async def generate_analysis_page(self, symbol: str, asset_type: AssetType = AssetType.STOCK) -> Optional[str]:
+    async def generate_analysis_page(self, symbol: str, asset_type: AssetType = AssetType.STOCK,
+                                     generated_at: Optional[str] = None) -> Optional[str]:
         """Generate a comprehensive analysis page for a single stock/crypto"""
         try:
             logger.info(f"Generating comprehensive analysis page for {symbol}")
             
             # Get watchlist data for targets
-            db_session = next(get_database_session())
-            watchlist_service = WatchlistService(db_session)
-            watchlist_ticker = watchlist_service.get_ticker(symbol)
-            db_session.close()
+            with get_db_session() as db_session:
+                watchlist_service = WatchlistService(db_session)
+                watchlist_ticker = watchlist_service.get_ticker(symbol)
             
             # Get real market data and comprehensive fundamentals
             logger.info(f"Fetching real market data and fundamentals for {symbol}")
@@ -44,16 +62,15 @@ class EnhancedAnalysisGenerator:
             
             # Generate HTML based on asset type
             if asset_type == AssetType.CRYPTO:
-                html_content = self._generate_crypto_html(analysis, watchlist_ticker, fundamental_data)
+                html_content = self._generate_crypto_html(analysis, watchlist_ticker, fundamental_data, generated_at)
             else:
-                html_content = self._generate_comprehensive_stock_html(analysis, watchlist_ticker, fundamental_data)
+                html_content = self._generate_comprehensive_stock_html(analysis, watchlist_ticker, fundamental_data, generated_at)
             
             # Save to file
             filename = f"{symbol.lower()}_analysis.html"
             filepath = self.output_dir / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            await asyncio.to_thread(self._write_page, filepath, html_content)
             
             logger.info(f"Comprehensive analysis page generated: {filepath}")
             return str(filepath)
@@ -62,6 +79,14 @@ class EnhancedAnalysisGenerator:
             logger.error(f"Error generating analysis page for {symbol}: {e}")
             return None
     
+    def _write_page(self, filepath: Path, html_content: str):
+        """Write the page plus a gzipped sibling for clients that accept gzip"""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        with gzip.open(f"{filepath}.gz", 'wt', compresslevel=6, encoding='utf-8') as gf:
+            gf.write(html_content)
+    
     def _create_mock_analysis(self, symbol: str, watchlist_ticker: Any, real_data: Any = None, company_profile: Dict = None, fundamental_data: Dict = None):
         """Create mock analysis data for demonstration purposes"""
         from types import SimpleNamespace
@@ -358,21 +383,16 @@ class EnhancedAnalysisGenerator:
     
     def _generate_score_bar(self, label: str, score: float) -> str:
         """Generate a score bar HTML"""
-        score_class = 'score-high' if score >= 70 else 'score-medium' if score >= 40 else 'score-low'
-        return f"""
-        <div style="margin-bottom: 20px;">
-            <div style="display: flex; justify-content: space-between; margin-bottom: 4px;">
-                <span>{label}</span>
-                <span>{score:.1f}/100</span>
-            </div>
-            <div class="score-bar">
-                <div class="score-fill {score_class}" style="width: {score}%;"></div>
-            </div>
-        </div>"""
+        # Discretize to the displayed precision so repeated scores hit the cache
+        return _score_bar_cached(label, round(score, 1))
     
-    def _generate_comprehensive_stock_html(self, analysis: Any, watchlist_ticker: Any, fundamental_data: Dict = None) -> str:
+    def _generate_comprehensive_stock_html(self, analysis: Any, watchlist_ticker: Any, fundamental_data: Dict = None,
+                                           generated_at: Optional[str] = None) -> str:
         """Generate comprehensive HTML for stock analysis with full technical detail"""
         
+        if generated_at is None:
+            generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
         # Extract data with safe defaults
         symbol = analysis.symbol
         company_name = analysis.company_name or symbol
@@ -439,6 +459,17 @@ class EnhancedAnalysisGenerator:
         recommended_stop = support_2
         recommended_target = resistance_2
         
+        # Derived price levels and ratios used by the template
+        max_pain_price = current_price * 0.985
+        entry_zone_hi = current_price * 0.98
+        stop_risk_pct = (current_price - recommended_stop) / current_price * 100 if current_price else 0.0
+        target_upside_pct = (recommended_target - current_price) / current_price * 100 if current_price else 0.0
+        
+        # Guard risk/reward against a stop at (or above) the current price
+        rr_denom = current_price - recommended_stop
+        rr_ratio = (recommended_target - current_price) / rr_denom if rr_denom > 1e-6 else float('inf')
+        rr_ratio_display = "∞" if math.isinf(rr_ratio) else f"{rr_ratio:.1f}"
+        
         # Generate comprehensive HTML
         html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -1445,7 +1476,7 @@ class EnhancedAnalysisGenerator:
                     </div>
                     <div class="options-card">
                         <h5>Max Pain</h5>
-                        <div style="font-size: 1.5rem; font-weight: 600; color: #ffffff;">${current_price * 0.985:.0f}</div>
+                        <div style="font-size: 1.5rem; font-weight: 600; color: #ffffff;">${max_pain_price:.0f}</div>
                         <p>Weekly expiration level</p>
                     </div>
                 </div>
@@ -1484,10 +1515,10 @@ class EnhancedAnalysisGenerator:
             <h2 class="section-title">🎯 Trading Strategy</h2>
             <div class="analysis-card">
                 <h3>Recommended Entry Strategy</h3>
-                <p><strong>Entry Zone:</strong> ${recommended_entry:.2f} - ${current_price * 0.98:.2f}</p>
-                <p><strong>Stop Loss:</strong> ${recommended_stop:.2f} (Risk: {((current_price - recommended_stop) / current_price * 100):.1f}%)</p>
-                <p><strong>Price Target:</strong> ${recommended_target:.2f} (Upside: {((recommended_target - current_price) / current_price * 100):.1f}%)</p>
-                <p><strong>Risk/Reward Ratio:</strong> 1:{((recommended_target - current_price) / (current_price - recommended_stop)):.1f}</p>
+                <p><strong>Entry Zone:</strong> ${recommended_entry:.2f} - ${entry_zone_hi:.2f}</p>
+                <p><strong>Stop Loss:</strong> ${recommended_stop:.2f} (Risk: {stop_risk_pct:.1f}%)</p>
+                <p><strong>Price Target:</strong> ${recommended_target:.2f} (Upside: {target_upside_pct:.1f}%)</p>
+                <p><strong>Risk/Reward Ratio:</strong> 1:{rr_ratio_display}</p>
                 
                 <h4 style="margin-top: 24px; color: #f0883e;">Key Trading Notes:</h4>
                 <p>• Monitor volume confirmation on breakout above ${resistance_1:.2f}</p>
@@ -1498,7 +1529,7 @@ class EnhancedAnalysisGenerator:
         </section>
         
         <div style="padding: 40px 0; text-align: center; color: #8b949e; border-top: 1px solid #1e2936;">
-            <p>Analysis generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} EST</p>
+            <p>Analysis generated: {generated_at} EST</p>
             <p style="margin-top: 8px;">
                 <a href="/api/watchlist/refresh/{symbol}" style="color: #58a6ff; text-decoration: none;">🔄 Refresh Data</a> | 
                 <a href="/watchlist" style="color: #58a6ff; text-decoration: none;">📊 Back to Watchlist</a>
@@ -1510,10 +1541,11 @@ class EnhancedAnalysisGenerator:
         
         return html
     
-    def _generate_crypto_html(self, analysis: Any, watchlist_ticker: Any, fundamental_data: Dict = None) -> str:
+    def _generate_crypto_html(self, analysis: Any, watchlist_ticker: Any, fundamental_data: Dict = None,
+                              generated_at: Optional[str] = None) -> str:
         """Generate HTML for crypto analysis (similar structure but crypto-focused)"""
         # For now, use the stock template with minor modifications
-        html = self._generate_comprehensive_stock_html(analysis, watchlist_ticker, fundamental_data)
+        html = self._generate_comprehensive_stock_html(analysis, watchlist_ticker, fundamental_data, generated_at)
         
         # Replace TradingView symbol for crypto
         if analysis.symbol in ["BTC", "ETH"]:
@@ -1528,23 +1560,24 @@ class EnhancedAnalysisGenerator:
         
         try:
             # Get all watchlist tickers
-            db_session = next(get_database_session())
-            watchlist_service = WatchlistService(db_session)
-            tickers = watchlist_service.get_all_tickers(active_only=True)
-            
-            logger.info(f"Generating comprehensive analysis pages for {len(tickers)} tickers")
-            
-            for ticker in tickers:
-                filepath = await self.generate_analysis_page(ticker.symbol, ticker.asset_type)
-                if filepath:
-                    results[ticker.symbol] = filepath
-                else:
-                    results[ticker.symbol] = None
+            with get_db_session() as db_session:
+                watchlist_service = WatchlistService(db_session)
+                tickers = watchlist_service.get_all_tickers(active_only=True)
                 
-                # Small delay between generations
-                await asyncio.sleep(1)
-            
-            db_session.close()
+                logger.info(f"Generating comprehensive analysis pages for {len(tickers)} tickers")
+                
+                # One footer timestamp for the whole batch
+                generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                
+                for ticker in tickers:
+                    filepath = await self.generate_analysis_page(ticker.symbol, ticker.asset_type, generated_at)
+                    if filepath:
+                        results[ticker.symbol] = filepath
+                    else:
+                        results[ticker.symbol] = None
+                    
+                    # Small delay between generations
+                    await asyncio.sleep(1)
             
         except Exception as e:
             logger.error(f"Error generating watchlist pages: {e}")
@@ -8,7 +8,7 @@ from ..core.config import settings
 from ..data_collectors.fundamental_data_collector import FundamentalDataCollector
 from ..data_collectors.technical_data_collector import TechnicalDataCollector
 from .watchlist_service import WatchlistService
-from ..database.watchlist_models import get_database_session, AssetType
+from ..database.watchlist_models import get_db_session, AssetType
 
 logger = logging.getLogger(__name__)
 
@@ -18,52 +18,55 @@ class MarketDataService:
     def __init__(self):
         self.fundamental_collector = FundamentalDataCollector()
         self.technical_collector = TechnicalDataCollector()
+        # CoinGecko conditional-request state, keyed by coin id
+        self._etag_cache: Dict[str, str] = {}
+        self._price_cache: Dict[str, Dict[str, Any]] = {}
         
     async def update_all_watchlist_data(self) -> Dict[str, Any]:
         """Update market data for all active watchlist tickers"""
+        # Snapshot one timestamp for the whole batch
+        now_iso = datetime.utcnow().isoformat()
         results = {
             "updated": [],
             "failed": [],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso,
             "total_processed": 0
         }
         
         try:
-            # Get database session
-            db_session = next(get_database_session())
-            watchlist_service = WatchlistService(db_session)
-            
-            # Get all active tickers
-            tickers = watchlist_service.get_all_tickers(active_only=True)
-            results["total_processed"] = len(tickers)
-            
-            logger.info(f"Updating market data for {len(tickers)} watchlist tickers")
-            
-            # Process each ticker
-            for ticker in tickers:
-                try:
-                    if ticker.asset_type == AssetType.CRYPTO:
-                        # Handle crypto data
-                        success = await self._update_crypto_data(watchlist_service, ticker.symbol)
-                    else:
-                        # Handle stock data
-                        success = await self._update_stock_data(watchlist_service, ticker.symbol)
-                    
-                    if success:
-                        results["updated"].append(ticker.symbol)
-                        logger.info(f"✅ Updated {ticker.symbol}")
-                    else:
-                        results["failed"].append(ticker.symbol)
-                        logger.warning(f"❌ Failed to update {ticker.symbol}")
+            # Get database session (closed even if an update raises)
+            with get_db_session() as db_session:
+                watchlist_service = WatchlistService(db_session)
+                
+                # Get all active tickers
+                tickers = watchlist_service.get_all_tickers(active_only=True)
+                results["total_processed"] = len(tickers)
+                
+                logger.info(f"Updating market data for {len(tickers)} watchlist tickers")
+                
+                # Process each ticker
+                for ticker in tickers:
+                    try:
+                        if ticker.asset_type == AssetType.CRYPTO:
+                            # Handle crypto data
+                            success = await self._update_crypto_data(watchlist_service, ticker.symbol)
+                        else:
+                            # Handle stock data
+                            success = await self._update_stock_data(watchlist_service, ticker.symbol)
                         
-                    # Small delay to respect rate limits
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"Error updating {ticker.symbol}: {e}")
-                    results["failed"].append(ticker.symbol)
-            
-            db_session.close()
+                        if success:
+                            results["updated"].append(ticker.symbol)
+                            logger.info(f"✅ Updated {ticker.symbol}")
+                        else:
+                            results["failed"].append(ticker.symbol)
+                            logger.warning(f"❌ Failed to update {ticker.symbol}")
+                            
+                        # Small delay to respect rate limits
+                        await asyncio.sleep(0.5)
+                        
+                    except Exception as e:
+                        logger.error(f"Error updating {ticker.symbol}: {e}")
+                        results["failed"].append(ticker.symbol)
             
         except Exception as e:
             logger.error(f"Error in update_all_watchlist_data: {e}")
@@ -74,15 +77,25 @@ class MarketDataService:
     async def _update_stock_data(self, watchlist_service: WatchlistService, symbol: str) -> bool:
         """Update data for a stock ticker"""
         try:
-            # Get fundamental data (price, market cap, etc.)
-            fundamental_data = await self.fundamental_collector.get_fundamental_data(symbol)
+            # Fetch fundamental (price, market cap, etc.) and technical (RSI, etc.) data concurrently
+            fundamental_data, technical_data = await asyncio.gather(
+                self.fundamental_collector.get_fundamental_data(symbol),
+                self.technical_collector.get_technical_indicators(symbol),
+                return_exceptions=True
+            )
             
-            # Get technical data (RSI, etc.)
-            technical_data = await self.technical_collector.get_technical_indicators(symbol)
+            if isinstance(fundamental_data, Exception):
+                logger.error(f"Error fetching fundamental data for {symbol}: {fundamental_data}")
+                fundamental_data = None
+            if isinstance(technical_data, Exception):
+                logger.error(f"Error fetching technical data for {symbol}: {technical_data}")
+                technical_data = None
             
             if not fundamental_data and not technical_data:
                 return False
             
+            ticker = watchlist_service.get_ticker(symbol)
+            
             # Prepare update data
             update_data = {}
             
@@ -92,16 +105,6 @@ class MarketDataService:
                     "market_cap": fundamental_data.market_cap,
                     "volume_24h": getattr(fundamental_data, 'volume', None),
                 })
-                
-                # Calculate 24h change if we have previous price
-                ticker = watchlist_service.get_ticker(symbol)
-                if ticker and ticker.current_price and fundamental_data.current_price:
-                    price_change = fundamental_data.current_price - ticker.current_price
-                    price_change_percent = (price_change / ticker.current_price) * 100
-                    update_data.update({
-                        "price_change_24h": price_change,
-                        "price_change_percent_24h": price_change_percent
-                    })
             
             if technical_data:
                 update_data.update({
@@ -109,6 +112,23 @@ class MarketDataService:
                     "macd_signal": self._get_macd_signal(technical_data)
                 })
             
+            # Nothing moved: skip the market data UPDATE and history row, but still
+            # record the check and evaluate alerts (one may have been added since)
+            if ticker and update_data and all(
+                getattr(ticker, key, None) == value
+                for key, value in update_data.items() if value is not None
+            ):
+                return watchlist_service.mark_ticker_checked(symbol)
+            
+            # Calculate 24h change if we have previous price
+            if fundamental_data and ticker and ticker.current_price and fundamental_data.current_price:
+                price_change = fundamental_data.current_price - ticker.current_price
+                price_change_percent = (price_change / ticker.current_price) * 100
+                update_data.update({
+                    "price_change_24h": price_change,
+                    "price_change_percent_24h": price_change_percent
+                })
+            
             # Update in database
             if update_data:
                 success = watchlist_service.update_ticker_market_data(
@@ -174,19 +194,31 @@ class MarketDataService:
                 "include_market_cap": "true"
             }
             
+            # Revalidate with the last ETag so unchanged prices come back as an empty 304
+            headers = {"If-None-Match": self._etag_cache[coin_id]} if coin_id in self._etag_cache else {}
+            
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
+                async with session.get(url, params=params, headers=headers) as response:
+                    if response.status == 304 and coin_id in self._price_cache:
+                        return self._price_cache[coin_id]
+                    
                     if response.status == 200:
                         data = await response.json()
                         
                         if coin_id in data:
                             coin_data = data[coin_id]
-                            return {
+                            crypto_data = {
                                 "current_price": coin_data.get("usd"),
                                 "price_change_percent_24h": coin_data.get("usd_24h_change"),
                                 "volume_24h": coin_data.get("usd_24h_vol"),
                                 "market_cap": coin_data.get("usd_market_cap")
                             }
+                            
+                            etag = response.headers.get("ETag")
+                            if etag:
+                                self._etag_cache[coin_id] = etag
+                            self._price_cache[coin_id] = crypto_data
+                            return crypto_data
             
             return None
             
@@ -197,20 +229,16 @@ class MarketDataService:
     async def update_single_ticker(self, symbol: str) -> bool:
         """Update market data for a single ticker"""
         try:
-            db_session = next(get_database_session())
-            watchlist_service = WatchlistService(db_session)
-            
-            ticker = watchlist_service.get_ticker(symbol)
-            if not ticker:
-                return False
-            
-            if ticker.asset_type == AssetType.CRYPTO:
-                success = await self._update_crypto_data(watchlist_service, symbol)
-            else:
-                success = await self._update_stock_data(watchlist_service, symbol)
-            
-            db_session.close()
-            return success
+            with get_db_session() as db_session:
+                watchlist_service = WatchlistService(db_session)
+                
+                ticker = watchlist_service.get_ticker(symbol)
+                if not ticker:
+                    return False
+                
+                if ticker.asset_type == AssetType.CRYPTO:
+                    return await self._update_crypto_data(watchlist_service, symbol)
+                return await self._update_stock_data(watchlist_service, symbol)
             
         except Exception as e:
             logger.error(f"Error updating single ticker {symbol}: {e}")
@@ -218,15 +246,11 @@ class MarketDataService:
     
     def _get_macd_signal(self, technical_data) -> str:
         """Convert MACD data to simple signal"""
-        try:
-            if hasattr(technical_data, 'macd') and hasattr(technical_data, 'macd_signal'):
-                if technical_data.macd > technical_data.macd_signal:
-                    return "bullish"
-                elif technical_data.macd < technical_data.macd_signal:
-                    return "bearish"
-            return "neutral"
-        except:
+        macd = getattr(technical_data, 'macd', None)
+        signal = getattr(technical_data, 'macd_signal', None)
+        if macd is None or signal is None:
             return "neutral"
+        return "bullish" if macd > signal else ("bearish" if macd < signal else "neutral")
 
 class MarketDataScheduler:
     """Scheduler for automatic market data updates"""
@@ -234,12 +258,18 @@ class MarketDataScheduler:
     def __init__(self, update_interval_minutes: int = 10):
         self.update_interval = update_interval_minutes * 60  # Convert to seconds
         self.market_data_service = MarketDataService()
-        self.running = False
+        # Set while stopped; stop_scheduler() sets it to wake the loop mid-sleep
+        self._stop_event = asyncio.Event()
+        self._stop_event.set()
         self.last_update = None
+    
+    @property
+    def running(self) -> bool:
+        return not self._stop_event.is_set()
         
     async def start_scheduler(self):
         """Start the automatic update scheduler"""
-        self.running = True
+        self._stop_event.clear()
         logger.info(f"Starting market data scheduler (every {self.update_interval/60} minutes)")
         
         while self.running:
@@ -252,24 +282,32 @@ class MarketDataScheduler:
                 logger.info(f"Scheduled update completed: {len(results['updated'])} updated, {len(results['failed'])} failed")
                 
                 # Wait for next update
-                await asyncio.sleep(self.update_interval)
+                delay = self.update_interval
                 
             except Exception as e:
                 logger.error(f"Error in scheduled update: {e}")
-                await asyncio.sleep(60)  # Wait 1 minute before retrying
+                delay = 60  # Wait 1 minute before retrying
+            
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                continue
+            else:
+                break
     
     def stop_scheduler(self):
         """Stop the automatic update scheduler"""
-        self.running = False
+        self._stop_event.set()
         logger.info("Market data scheduler stopped")
     
     def get_status(self) -> Dict[str, Any]:
         """Get scheduler status"""
+        last_update = self.last_update
         return {
             "running": self.running,
             "update_interval_minutes": self.update_interval / 60,
-            "last_update": self.last_update.isoformat() if self.last_update else None,
-            "next_update": (self.last_update + timedelta(seconds=self.update_interval)).isoformat() if self.last_update else None
+            "last_update": last_update.isoformat() if last_update else None,
+            "next_update": (last_update + timedelta(seconds=self.update_interval)).isoformat() if last_update else None
         }
 
 # Global scheduler instance
@@ -1,21 +1,282 @@
 import asyncio
-import aiohttp
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import httpx
+import numpy as np
+import orjson
+import random
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import date, datetime
 import logging
+import time
 
 from ..core.config import settings
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.rate_limiter import RateLimiter
+from ..utils._njit import njit
 from .watchlist_service import WatchlistService
-from ..database.watchlist_models import get_database_session, AssetType
+from ..database.watchlist_models import get_db_session, AssetType
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
 
 logger = logging.getLogger(__name__)
 
+# Map common symbols to CoinGecko IDs
+_CG_SYMBOL_MAP = {
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "ADA": "cardano",
+    "DOT": "polkadot",
+    "LINK": "chainlink",
+    "UNI": "uniswap",
+    "AAVE": "aave",
+    "SUSHI": "sushi"
+}
+# Upstream endpoints, split so request URLs are a plain concatenation with the symbol(s)
+_FMP_QUOTE_URL = "https://financialmodelingprep.com/api/v3/quote/"
+_FMP_HISTORY_URL = "https://financialmodelingprep.com/api/v3/historical-price-full/"
+_POLYGON_AGGS_URL = "https://api.polygon.io/v2/aggs/ticker/"
+_COINGECKO_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price"
+_CG_PARAMS = {
+    "vs_currencies": "usd",
+    "include_24hr_change": "true",
+    "include_24hr_vol": "true",
+    "include_market_cap": "true"
+}
+# Statuses worth retrying; anything else is returned to the caller as-is
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_RETRY_DELAY = 10
+# FMP's quote endpoint takes comma-separated symbols; chunk to keep URLs a sane length
+_FMP_BATCH_SIZE = 500
+# Quotes are reused for one scheduler-ish window before hitting the upstream APIs again
+_QUOTE_CACHE_TTL = 60
+_QUOTE_CACHE_MAX_ENTRIES = 1024
+
+# Change-percent bucket edges and the simple RSI for each bucket (see _calculate_simple_rsi)
+_RSI_THRESHOLDS = np.array([-5.0, -2.0, 0.0, 2.0, 5.0])
+_RSI_VALUES = np.array([20.0, 30.0, 40.0, 60.0, 70.0, 80.0])
+
+# Wilder RSI over daily closes; history changes once a day, so it is cached for an hour
+_RSI_PERIOD = 14
+_MACD_FAST, _MACD_SLOW, _MACD_SIGNAL = 12, 26, 9
+_HISTORY_DAYS = 60  # Enough bars for the Wilder average to settle
+_HISTORY_CACHE_TTL = 3600
+
+def _calculate_simple_rsi_batch(change_percents: np.ndarray) -> np.ndarray:
+    """Vectorized _calculate_simple_rsi; NaN (missing) changes map to 50"""
+    # side='left' keeps the scalar version's strict '>' at each edge
+    rsi = _RSI_VALUES[np.searchsorted(_RSI_THRESHOLDS, change_percents, side='left')]
+    return np.where(np.isnan(change_percents), 50.0, rsi)
+
+# Recursive smoothing can't be vectorized, so these loops are JIT-compiled when numba is installed
+@njit(cache=True)
+def _rsi_wilder_loop(gains: np.ndarray, losses: np.ndarray, period: int) -> Tuple[float, float]:
+    """Wilder-smoothed average gain and loss, seeded with the simple mean of the first period"""
+    avg_gain = gains[:period].mean()
+    avg_loss = losses[:period].mean()
+    for i in range(period, gains.shape[0]):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+    return avg_gain, avg_loss
+
+@njit(cache=True)
+def _ema_loop(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average seeded with the first value"""
+    alpha = 2.0 / (span + 1.0)
+    ema = np.empty_like(values)
+    ema[0] = values[0]
+    for i in range(1, values.shape[0]):
+        ema[i] = alpha * values[i] + (1.0 - alpha) * ema[i - 1]
+    return ema
+
+@njit(cache=True)
+def _macd_loop(closes: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[np.ndarray, np.ndarray]:
+    """MACD line and its signal line"""
+    macd = _ema_loop(closes, fast) - _ema_loop(closes, slow)
+    return macd, _ema_loop(macd, signal)
+
+def _compute_rsi_wilder(closes: np.ndarray, period: int = _RSI_PERIOD) -> Optional[float]:
+    """Wilder-smoothed RSI at the last close; None with fewer than period + 1 closes"""
+    if len(closes) <= period:
+        return None
+    
+    delta = np.diff(closes)
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.where(delta < 0, -delta, 0.0)
+    avg_gain, avg_loss = _rsi_wilder_loop(gains, losses, period)
+    
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    return float(100 - 100 / (1 + avg_gain / avg_loss))
+
+def _compute_macd_signal(closes: np.ndarray) -> Optional[str]:
+    """bullish/bearish/neutral from the MACD histogram at the last close; None without enough closes"""
+    if len(closes) < _MACD_SLOW + _MACD_SIGNAL:
+        return None
+    
+    macd, signal = _macd_loop(closes, _MACD_FAST, _MACD_SLOW, _MACD_SIGNAL)
+    histogram = macd[-1] - signal[-1]
+    if histogram > 0:
+        return "bullish"
+    elif histogram < 0:
+        return "bearish"
+    return "neutral"
+
+def _get_simple_macd_signal_batch(change_percents: np.ndarray) -> np.ndarray:
+    """Vectorized _get_simple_macd_signal; NaN compares false and falls through to neutral"""
+    return np.select([change_percents > 1, change_percents < -1], ['bullish', 'bearish'], default='neutral')
+
 class SimpleMarketDataService:
     """Simplified market data service using your configured APIs"""
     
     def __init__(self):
         self.polygon_api_key = settings.polygon_api_key
         self.fmp_api_key = settings.fmp_api_key
+        # FMP and CoinGecko serve HTTP/2, so concurrent requests multiplex over one connection
+        self._client: Optional[httpx.AsyncClient] = None
+        # Query strings that only depend on the keys are built once
+        self._fmp_params = {"apikey": self.fmp_api_key}
+        self._fmp_history_params = {**self._fmp_params, "serietype": "line", "timeseries": _HISTORY_DAYS}
+        self._polygon_params = {"apikey": self.polygon_api_key}
+        
+        # Concurrency caps per upstream; the rate limiters pace requests within them
+        self._stock_semaphore = asyncio.Semaphore(5)
+        self._fmp_limiter = RateLimiter(requests_per_minute=300)
+        self._polygon_limiter = RateLimiter(requests_per_minute=5)  # Free tier limit
+        self._coingecko_limiter = RateLimiter(requests_per_minute=30)  # Free tier limit
+        self._limiters = {
+            "fmp": self._fmp_limiter,
+            "polygon": self._polygon_limiter,
+            "coingecko": self._coingecko_limiter
+        }
+        # While an upstream keeps failing, skip it for a minute instead of spending rate budget on it
+        self._breakers = {source: CircuitBreaker(failure_threshold=5, reset_timeout=60) for source in self._limiters}
+        
+        # Quote cache keyed "<source>:<symbol>"; in-process unless Redis is configured
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        self._cache_stats = {"hits": 0, "misses": 0}
+        # symbol -> (expires_at, daily closes oldest first)
+        self._close_history: Dict[str, Tuple[float, np.ndarray]] = {}
+        self._redis = None
+        if settings.market_data_cache_backend == "redis":
+            if aioredis is not None:
+                self._redis = aioredis.from_url(settings.redis_url)
+            else:
+                logger.warning("redis is not installed, using the in-process quote cache")
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the persistent HTTP/2 client, created on first use so connections are kept alive between fetches"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=30, keepalive_expiry=300),
+                timeout=10.0
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the HTTP client at shutdown"""
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        
+        if self._redis is not None:
+            await self._redis.close()
+    
+    async def _get_with_retry(self, source: str, url: str, params: Dict[str, Any],
+                              retries: int = 2) -> Optional[httpx.Response]:
+        """GET from an upstream, retrying 429/5xx with Retry-After or jittered exponential backoff
+        
+        Each attempt waits on the source's rate limiter. Returns None without making
+        a request while the source's circuit is open.
+        """
+        breaker = self._breakers[source]
+        if not breaker.allow_request():
+            logger.debug("%s circuit open, skipping %s", source, url)
+            return None
+        
+        limiter = self._limiters[source]
+        client = self._get_client()
+        for attempt in range(retries + 1):
+            retry_after = None
+            await limiter.wait()
+            try:
+                response = await client.get(url, params=params)
+                if response.status_code not in _RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                retry_after = response.headers.get('Retry-After')
+            except httpx.HTTPError:
+                if attempt == retries:
+                    breaker.record_failure()
+                    raise
+            
+            if attempt < retries:
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt + random.random()
+                await asyncio.sleep(min(delay, _MAX_RETRY_DELAY))
+        
+        breaker.record_failure()
+        return response
+    
+    async def _cache_get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up cached quotes, returning only the keys that are present and fresh"""
+        found = {}
+        if self._redis is not None:
+            try:
+                for key, raw in zip(keys, await self._redis.mget(keys)):
+                    if raw:
+                        found[key] = orjson.loads(raw)
+            except Exception as e:
+                logger.warning("Redis quote cache read failed: %s", e)
+        else:
+            now = time.monotonic()
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry and entry[0] > now:
+                    found[key] = entry[1]
+        
+        self._cache_stats["hits"] += len(found)
+        self._cache_stats["misses"] += len(keys) - len(found)
+        return found
+    
+    async def _cache_set_many(self, values: Dict[str, Dict[str, Any]]):
+        """Store quotes for _QUOTE_CACHE_TTL seconds"""
+        if not values:
+            return
+        
+        if self._redis is not None:
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for key, value in values.items():
+                        pipe.setex(key, _QUOTE_CACHE_TTL, orjson.dumps(value))
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning("Redis quote cache write failed: %s", e)
+            return
+        
+        expires_at = time.monotonic() + _QUOTE_CACHE_TTL
+        for key, value in values.items():
+            self._cache.pop(key, None)
+            self._cache[key] = (expires_at, value)
+        # Entries are in expiry order, so trimming from the front drops the stalest first
+        while len(self._cache) > _QUOTE_CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+    
+    async def _cache_invalidate(self, symbol: str):
+        """Drop every cached quote for a symbol"""
+        keys = [f"{source}:{symbol}" for source in ("fmp", "polygon", "coingecko")]
+        if self._redis is not None:
+            try:
+                await self._redis.delete(*keys)
+            except Exception as e:
+                logger.warning("Redis quote cache delete failed: %s", e)
+        for key in keys:
+            self._cache.pop(key, None)
         
     async def update_all_watchlist_data(self) -> Dict[str, Any]:
         """Update market data for all active watchlist tickers"""
@@ -25,43 +286,103 @@ class SimpleMarketDataService:
             "timestamp": datetime.utcnow().isoformat(),
             "total_processed": 0
         }
+        started = time.perf_counter()
         
         try:
-            # Get database session
-            db_session = next(get_database_session())
-            watchlist_service = WatchlistService(db_session)
-            
-            # Get all active tickers
-            tickers = watchlist_service.get_all_tickers(active_only=True)
-            results["total_processed"] = len(tickers)
-            
-            logger.info(f"Updating market data for {len(tickers)} watchlist tickers")
-            
-            # Process each ticker
-            for ticker in tickers:
+            with get_db_session() as db_session:
+                watchlist_service = WatchlistService(db_session)
+                
+                # Get all active tickers
+                tickers = watchlist_service.get_all_tickers_lite()
+                results["total_processed"] = len(tickers)
+                
+                logger.info(f"Updating market data for {len(tickers)} watchlist tickers")
+                
+                # FMP and CoinGecko each quote the whole watchlist in batched requests
+                crypto_symbols = [symbol for symbol, asset_type in tickers if asset_type == AssetType.CRYPTO]
+                stock_symbols = [symbol for symbol, asset_type in tickers if asset_type != AssetType.CRYPTO]
+                crypto_quotes, stock_quotes = await asyncio.gather(
+                    self._fetch_crypto_data_batch(crypto_symbols),
+                    self._fetch_fmp_quote_batch(stock_symbols)
+                )
+                
+                # Everything the batches returned is written in one transaction
+                stock_items = list(stock_quotes.items())
+                crypto_items = list(crypto_quotes.items())
+                # Simple indicators for the whole batch in one vectorized pass; None becomes NaN
+                stock_changes = np.array([quote.get('changesPercentage') for _, quote in stock_items], dtype=np.float64)
+                crypto_changes = np.array([data.get("price_change_percent_24h") for _, data in crypto_items], dtype=np.float64)
+                
+                # Stocks get a real Wilder RSI and MACD where FMP has price history
+                async def history_indicators(symbol: str, quote: Dict[str, Any]) -> Tuple[Optional[float], Optional[str]]:
+                    async with self._stock_semaphore:
+                        return await self._calculate_indicators(symbol, quote.get('price'))
+                
+                stock_indicators = await asyncio.gather(
+                    *(history_indicators(symbol, quote) for symbol, quote in stock_items)
+                )
+                
+                updates = [
+                    self._fmp_update_fields(symbol, quote,
+                                            rsi if rsi is not None else simple_rsi,
+                                            macd or simple_macd)
+                    for (symbol, quote), (rsi, macd), simple_rsi, simple_macd in zip(
+                        stock_items,
+                        stock_indicators,
+                        _calculate_simple_rsi_batch(stock_changes).tolist(),
+                        _get_simple_macd_signal_batch(stock_changes).tolist()
+                    )
+                ]
+                updates.extend(
+                    self._crypto_update_fields(symbol, data, rsi)
+                    for (symbol, data), rsi in zip(crypto_items, _calculate_simple_rsi_batch(crypto_changes).tolist())
+                )
                 try:
-                    if ticker.asset_type == AssetType.CRYPTO:
-                        # Handle crypto data
-                        success = await self._update_crypto_data(watchlist_service, ticker.symbol)
-                    else:
-                        # Handle stock data
-                        success = await self._update_stock_data(watchlist_service, ticker.symbol)
-                    
-                    if success:
-                        results["updated"].append(ticker.symbol)
-                        logger.info(f"✅ Updated {ticker.symbol}")
-                    else:
-                        results["failed"].append(ticker.symbol)
-                        logger.warning(f"❌ Failed to update {ticker.symbol}")
-                        
-                    # Small delay to respect rate limits
-                    await asyncio.sleep(1)  # Be conservative with rate limits
-                    
+                    outcomes: Dict[str, Any] = watchlist_service.update_tickers_batch(updates)
                 except Exception as e:
-                    logger.error(f"Error updating {ticker.symbol}: {e}")
-                    results["failed"].append(ticker.symbol)
+                    logger.error(f"Error writing batched market data: {e}")
+                    db_session.rollback()
+                    outcomes = {}
+                
+                # Stocks FMP didn't quote fall back to Polygon, concurrently under the stock semaphore
+                fallback_symbols = [symbol for symbol in stock_symbols if symbol not in stock_quotes]
+                
+                async def run_fallback(symbol: str) -> bool:
+                    async with self._stock_semaphore:
+                        # {} skips a second FMP request for a symbol the batch already missed
+                        return await self._update_stock_data(watchlist_service, symbol, {})
+                
+                fallback_outcomes = await asyncio.gather(
+                    *(run_fallback(symbol) for symbol in fallback_symbols), return_exceptions=True
+                )
+                outcomes.update(zip(fallback_symbols, fallback_outcomes))
+                
+                # Per-ticker lines are debug-level and lazily formatted; one summary goes out at info
+                debug = logger.isEnabledFor(logging.DEBUG)
+                for symbol, _ in tickers:
+                    outcome = outcomes.get(symbol, False)
+                    if isinstance(outcome, Exception):
+                        logger.error("Error updating %s: %s", symbol, outcome)
+                        results["failed"].append(symbol)
+                    elif outcome:
+                        results["updated"].append(symbol)
+                        if debug:
+                            logger.debug("✅ Updated %s", symbol)
+                    else:
+                        results["failed"].append(symbol)
+                        if debug:
+                            logger.debug("❌ Failed to update %s", symbol)
             
-            db_session.close()
+            logger.info(
+                "Updated %d/%d tickers in %.2fs",
+                len(results["updated"]), len(tickers), time.perf_counter() - started
+            )
+            if results["failed"]:
+                logger.warning("Failed to update: %s", ", ".join(results["failed"]))
+            
+            logger.info(
+                "Quote cache: %d hits, %d misses", self._cache_stats["hits"], self._cache_stats["misses"]
+            )
             
         except Exception as e:
             logger.error(f"Error in update_all_watchlist_data: {e}")
@@ -69,36 +390,23 @@ class SimpleMarketDataService:
         
         return results
     
-    async def _update_stock_data(self, watchlist_service: WatchlistService, symbol: str) -> bool:
-        """Update data for a stock ticker using FMP and Polygon APIs"""
+    async def _update_stock_data(self, watchlist_service: WatchlistService, symbol: str,
+                                 fmp_data: Optional[Dict[str, Any]] = None) -> bool:
+        """Update data for a stock ticker using FMP and Polygon APIs
+        
+        Pass fmp_data when the FMP quote was already fetched as part of a batch.
+        """
         try:
             # Try FMP first (you have this configured)
-            fmp_data = await self._fetch_fmp_quote(symbol)
+            if fmp_data is None:
+                fmp_data = await self._fetch_fmp_quote(symbol)
             
             if fmp_data:
-                # Extract data from FMP response
-                current_price = fmp_data.get('price')
-                market_cap = fmp_data.get('marketCap')
-                volume = fmp_data.get('volume')
-                change = fmp_data.get('change')
-                change_percent = fmp_data.get('changesPercentage')
-                
-                # Calculate RSI using simple approximation (you can enhance this)
-                rsi = self._calculate_simple_rsi(change_percent)
-                
+                rsi, macd = await self._calculate_indicators(symbol, fmp_data.get('price'))
                 # Update in database
-                success = watchlist_service.update_ticker_market_data(
-                    symbol=symbol,
-                    current_price=current_price,
-                    price_change_24h=change,
-                    price_change_percent_24h=change_percent,
-                    volume_24h=volume,
-                    market_cap=market_cap,
-                    rsi_14=rsi,
-                    macd_signal=self._get_simple_macd_signal(change_percent)
+                return watchlist_service.update_ticker_market_data(
+                    **self._fmp_update_fields(symbol, fmp_data, rsi, macd)
                 )
-                
-                return success
             
             # If FMP fails, try Polygon as backup
             if self.polygon_api_key:
@@ -112,43 +420,136 @@ class SimpleMarketDataService:
             logger.error(f"Error updating stock data for {symbol}: {e}")
             return False
     
-    async def _fetch_fmp_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Fetch current quote from Financial Modeling Prep"""
+    def _fmp_update_fields(self, symbol: str, fmp_data: Dict[str, Any],
+                           rsi_14: Optional[float] = None, macd_signal: Optional[str] = None) -> Dict[str, Any]:
+        """Map an FMP quote to update_ticker_market_data arguments
+        
+        Indicators not passed in (already computed for a batch) are computed here.
+        """
+        change_percent = fmp_data.get('changesPercentage')
+        return {
+            "symbol": symbol,
+            "current_price": fmp_data.get('price'),
+            "price_change_24h": fmp_data.get('change'),
+            "price_change_percent_24h": change_percent,
+            "volume_24h": fmp_data.get('volume'),
+            "market_cap": fmp_data.get('marketCap'),
+            # Calculate RSI using simple approximation (you can enhance this)
+            "rsi_14": rsi_14 if rsi_14 is not None else self._calculate_simple_rsi(change_percent),
+            "macd_signal": macd_signal or self._get_simple_macd_signal(change_percent)
+        }
+    
+    async def _calculate_indicators(self, symbol: str,
+                                    current_price: Optional[float]) -> Tuple[Optional[float], Optional[str]]:
+        """Wilder RSI and MACD signal over daily closes with the live price as the latest close
+        
+        Either is None when there isn't enough history.
+        """
+        if current_price is None:
+            return None, None
+        closes = await self._get_close_history(symbol)
+        if closes is None:
+            return None, None
+        closes = np.append(closes, current_price)
+        return _compute_rsi_wilder(closes), _compute_macd_signal(closes)
+    
+    async def _get_close_history(self, symbol: str) -> Optional[np.ndarray]:
+        """Daily closes before today, oldest first, cached for _HISTORY_CACHE_TTL seconds"""
+        entry = self._close_history.get(symbol)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        
+        closes = await self._fetch_fmp_close_history(symbol)
+        if closes is not None:
+            self._close_history[symbol] = (time.monotonic() + _HISTORY_CACHE_TTL, closes)
+        return closes
+    
+    async def _fetch_fmp_close_history(self, symbol: str) -> Optional[np.ndarray]:
+        """Fetch recent daily closes from Financial Modeling Prep"""
         try:
             if not self.fmp_api_key:
                 return None
-                
-            url = f"https://financialmodelingprep.com/api/v3/quote/{symbol}"
-            params = {"apikey": self.fmp_api_key}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data and len(data) > 0:
-                            return data[0]  # FMP returns array
+            response = await self._get_with_retry("fmp", _FMP_HISTORY_URL + symbol, self._fmp_history_params)
+            if response is not None and response.status_code == 200:
+                data = orjson.loads(response.content)
+                # FMP lists newest first; today's bar is superseded by the live price
+                today = date.today().isoformat()
+                historical = [day for day in data.get('historical') or [] if day.get('date') != today]
+                if historical:
+                    return np.array([day['close'] for day in reversed(historical)], dtype=np.float64)
             
             return None
             
         except Exception as e:
-            logger.error(f"Error fetching FMP quote for {symbol}: {e}")
+            logger.error(f"Error fetching FMP price history for {symbol}: {e}")
             return None
     
-    async def _fetch_polygon_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Fetch current quote from Polygon.io"""
+    async def _fetch_fmp_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch current quote from Financial Modeling Prep"""
+        return (await self._fetch_fmp_quote_batch([symbol])).get(symbol)
+    
+    async def _fetch_fmp_quote_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch current quotes for many symbols from Financial Modeling Prep, keyed by symbol"""
+        if not self.fmp_api_key or not symbols:
+            return {}
+        
+        cached = await self._cache_get_many([f"fmp:{symbol}" for symbol in symbols])
+        quotes = {symbol: cached[f"fmp:{symbol}"] for symbol in symbols if f"fmp:{symbol}" in cached}
+        missing = [symbol for symbol in symbols if symbol not in quotes]
+        
+        chunks = [missing[i:i + _FMP_BATCH_SIZE] for i in range(0, len(missing), _FMP_BATCH_SIZE)]
+        fetched = {}
+        for chunk_quotes in await asyncio.gather(*(self._fetch_fmp_quote_chunk(chunk) for chunk in chunks)):
+            fetched.update(chunk_quotes)
+        await self._cache_set_many({f"fmp:{symbol}": quote for symbol, quote in fetched.items()})
+        
+        quotes.update(fetched)
+        return quotes
+    
+    async def _fetch_fmp_quote_chunk(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch one comma-separated FMP quote request"""
         try:
-            if not self.polygon_api_key:
-                return None
-                
-            url = f"https://api.polygon.io/v2/aggs/ticker/{symbol}/prev"
-            params = {"apikey": self.polygon_api_key}
+            response = await self._get_with_retry("fmp", _FMP_QUOTE_URL + ",".join(symbols), self._fmp_params)
+            if response is not None and response.status_code == 200:
+                data = orjson.loads(response.content)
+                # FMP returns an array
+                return {item['symbol']: item for item in data or [] if item.get('symbol')}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('status') == 'OK' and data.get('results'):
-                            return data['results'][0]
+            return {}
+            
+        except Exception as e:
+            logger.error(f"Error fetching FMP quotes for {', '.join(symbols)}: {e}")
+            return {}
+    
+    async def _fetch_polygon_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch current quote from Polygon.io, served from the quote cache when fresh"""
+        if not self.polygon_api_key:
+            return None
+        
+        key = f"polygon:{symbol}"
+        # Concurrent callers for the same symbol wait for one request instead of all fetching
+        async with self._cache_locks.setdefault(key, asyncio.Lock()):
+            cached = await self._cache_get_many([key])
+            if key in cached:
+                return cached[key]
+            
+            quote = await self._request_polygon_quote(symbol)
+            if quote:
+                await self._cache_set_many({key: quote})
+            return quote
+    
+    async def _request_polygon_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Request the previous-day aggregate from Polygon.io"""
+        try:
+            # At 5 requests/minute a retry would only queue behind the limiter, so Polygon isn't retried
+            response = await self._get_with_retry(
+                "polygon", f"{_POLYGON_AGGS_URL}{symbol}/prev", self._polygon_params, retries=0
+            )
+            if response is not None and response.status_code == 200:
+                data = orjson.loads(response.content)
+                if data.get('status') == 'OK' and data.get('results'):
+                    return data['results'][0]
             
             return None
             
@@ -186,76 +587,87 @@ class SimpleMarketDataService:
             logger.error(f"Error processing Polygon data for {symbol}: {e}")
             return False
     
-    async def _update_crypto_data(self, watchlist_service: WatchlistService, symbol: str) -> bool:
-        """Update data for a crypto ticker using CoinGecko API (free)"""
+    async def _update_crypto_data(self, watchlist_service: WatchlistService, symbol: str,
+                                  crypto_data: Optional[Dict[str, Any]] = None) -> bool:
+        """Update data for a crypto ticker using CoinGecko API (free)
+        
+        Pass crypto_data when it was already fetched as part of a batch.
+        """
         try:
-            crypto_data = await self._fetch_crypto_data(symbol)
+            if crypto_data is None:
+                crypto_data = await self._fetch_crypto_data(symbol)
             
             if not crypto_data:
                 return False
             
             # Update in database
-            success = watchlist_service.update_ticker_market_data(
-                symbol=symbol,
-                current_price=crypto_data.get("current_price"),
-                price_change_24h=crypto_data.get("price_change_24h"),
-                price_change_percent_24h=crypto_data.get("price_change_percent_24h"),
-                volume_24h=crypto_data.get("volume_24h"),
-                market_cap=crypto_data.get("market_cap"),
-                rsi_14=self._calculate_simple_rsi(crypto_data.get("price_change_percent_24h", 0))
-            )
-            
-            return success
+            return watchlist_service.update_ticker_market_data(**self._crypto_update_fields(symbol, crypto_data))
             
         except Exception as e:
             logger.error(f"Error updating crypto data for {symbol}: {e}")
             return False
     
+    def _crypto_update_fields(self, symbol: str, crypto_data: Dict[str, Any],
+                              rsi_14: Optional[float] = None) -> Dict[str, Any]:
+        """Map CoinGecko data to update_ticker_market_data arguments"""
+        if rsi_14 is None:
+            rsi_14 = self._calculate_simple_rsi(crypto_data.get("price_change_percent_24h", 0))
+        return {
+            "symbol": symbol,
+            "current_price": crypto_data.get("current_price"),
+            "price_change_24h": crypto_data.get("price_change_24h"),
+            "price_change_percent_24h": crypto_data.get("price_change_percent_24h"),
+            "volume_24h": crypto_data.get("volume_24h"),
+            "market_cap": crypto_data.get("market_cap"),
+            "rsi_14": rsi_14
+        }
+    
     async def _fetch_crypto_data(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Fetch crypto data from CoinGecko API (free tier)"""
+        return (await self._fetch_crypto_data_batch([symbol])).get(symbol)
+    
+    async def _fetch_crypto_data_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch crypto data for many symbols in one CoinGecko /simple/price request"""
+        if not symbols:
+            return {}
+        
+        cached = await self._cache_get_many([f"coingecko:{symbol}" for symbol in symbols])
+        results = {symbol: cached[f"coingecko:{symbol}"] for symbol in symbols if f"coingecko:{symbol}" in cached}
+        missing = [symbol for symbol in symbols if symbol not in results]
+        if missing:
+            fetched = await self._request_crypto_data(missing)
+            await self._cache_set_many({f"coingecko:{symbol}": data for symbol, data in fetched.items()})
+            results.update(fetched)
+        return results
+    
+    async def _request_crypto_data(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Request /simple/price for the given symbols"""
         try:
-            # Map common symbols to CoinGecko IDs
-            symbol_map = {
-                "BTC": "bitcoin",
-                "ETH": "ethereum", 
-                "ADA": "cardano",
-                "DOT": "polkadot",
-                "LINK": "chainlink",
-                "UNI": "uniswap",
-                "AAVE": "aave",
-                "SUSHI": "sushi"
-            }
-            
-            coin_id = symbol_map.get(symbol.upper(), symbol.lower())
-            
-            url = f"https://api.coingecko.com/api/v3/simple/price"
-            params = {
-                "ids": coin_id,
-                "vs_currencies": "usd",
-                "include_24hr_change": "true",
-                "include_24hr_vol": "true",
-                "include_market_cap": "true"
-            }
+            coin_ids = {symbol: _CG_SYMBOL_MAP.get(symbol.upper(), symbol.lower()) for symbol in symbols}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if coin_id in data:
-                            coin_data = data[coin_id]
-                            return {
-                                "current_price": coin_data.get("usd"),
-                                "price_change_percent_24h": coin_data.get("usd_24h_change"),
-                                "volume_24h": coin_data.get("usd_24h_vol"),
-                                "market_cap": coin_data.get("usd_market_cap")
-                            }
+            params = {**_CG_PARAMS, "ids": ",".join(sorted(set(coin_ids.values())))}
             
-            return None
+            response = await self._get_with_retry("coingecko", _COINGECKO_PRICE_URL, params)
+            if response is not None and response.status_code == 200:
+                data = orjson.loads(response.content)
+                
+                results = {}
+                for symbol, coin_id in coin_ids.items():
+                    if coin_id in data:
+                        coin_data = data[coin_id]
+                        results[symbol] = {
+                            "current_price": coin_data.get("usd"),
+                            "price_change_percent_24h": coin_data.get("usd_24h_change"),
+                            "volume_24h": coin_data.get("usd_24h_vol"),
+                            "market_cap": coin_data.get("usd_market_cap")
+                        }
+                return results
+            
+            return {}
             
         except Exception as e:
-            logger.error(f"Error fetching crypto data for {symbol}: {e}")
-            return None
+            logger.error(f"Error fetching crypto data for {', '.join(symbols)}: {e}")
+            return {}
     
     def _calculate_simple_rsi(self, change_percent: float) -> float:
         """Simple RSI approximation based on price change"""
@@ -292,21 +704,25 @@ class SimpleMarketDataService:
     async def update_single_ticker(self, symbol: str) -> bool:
         """Update market data for a single ticker"""
         try:
-            db_session = next(get_database_session())
-            watchlist_service = WatchlistService(db_session)
-            
-            ticker = watchlist_service.get_ticker(symbol)
-            if not ticker:
-                return False
-            
-            if ticker.asset_type == AssetType.CRYPTO:
-                success = await self._update_crypto_data(watchlist_service, symbol)
-            else:
-                success = await self._update_stock_data(watchlist_service, symbol)
-            
-            db_session.close()
-            return success
+            with get_db_session() as db_session:
+                watchlist_service = WatchlistService(db_session)
+                
+                ticker = watchlist_service.get_ticker(symbol)
+                if not ticker:
+                    return False
+                
+                # A manual refresh should always go to the upstream APIs
+                await self._cache_invalidate(symbol)
+                
+                if ticker.asset_type == AssetType.CRYPTO:
+                    success = await self._update_crypto_data(watchlist_service, symbol)
+                else:
+                    success = await self._update_stock_data(watchlist_service, symbol)
+                return success
             
         except Exception as e:
             logger.error(f"Error updating single ticker {symbol}: {e}")
-            return False
\ No newline at end of file
+            return False
+
+# Singleton instance so the HTTP client is reused across refreshes
+simple_market_service = SimpleMarketDataService()
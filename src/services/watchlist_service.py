@@ -1,13 +1,72 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, func, select, update, insert, case, bindparam
 
 from ..database.watchlist_models import (
     WatchlistTicker, WatchlistAlert, WatchlistHistory, 
     AssetType, AlertType, Priority, WatchlistDatabase
 )
 
+_tickers = WatchlistTicker.__table__
+
+# One UPDATE per batch (executemany) keyed by id; max/min tracking is done in SQL
+# with CASE, which both SQLite and PostgreSQL support, instead of GREATEST/LEAST
+_BATCH_MARKET_DATA_UPDATE = (
+    update(_tickers)
+    .where(_tickers.c.id == bindparam('b_id'))
+    .values(
+        max_price_since_added=case(
+            (or_(_tickers.c.max_price_since_added.is_(None),
+                 _tickers.c.max_price_since_added < bindparam('b_price')), bindparam('b_price')),
+            else_=_tickers.c.max_price_since_added
+        ),
+        min_price_since_added=case(
+            (or_(_tickers.c.min_price_since_added.is_(None),
+                 _tickers.c.min_price_since_added > bindparam('b_price')), bindparam('b_price')),
+            else_=_tickers.c.min_price_since_added
+        ),
+        current_price=bindparam('b_price'),
+        price_change_24h=bindparam('b_change'),
+        price_change_percent_24h=bindparam('b_change_percent'),
+        volume_24h=bindparam('b_volume'),
+        market_cap=bindparam('b_market_cap'),
+        rsi_14=bindparam('b_rsi'),
+        macd_signal=bindparam('b_macd'),
+        date_last_checked=bindparam('b_checked')
+    )
+)
+
+_alerts = WatchlistAlert.__table__
+
+# The _check_alerts_for_ticker rules as one SQL predicate over an alert and its ticker
+_ALERT_TRIGGERED = select(_tickers.c.id).where(
+    _tickers.c.id == _alerts.c.ticker_id,
+    _tickers.c.current_price.isnot(None),
+    _tickers.c.current_price != 0,
+    or_(
+        and_(_alerts.c.alert_type == AlertType.PRICE_ABOVE,
+             _tickers.c.current_price >= _alerts.c.alert_value),
+        and_(_alerts.c.alert_type == AlertType.PRICE_BELOW,
+             _tickers.c.current_price <= _alerts.c.alert_value),
+        and_(_alerts.c.alert_type == AlertType.RSI_OVERSOLD,
+             _tickers.c.rsi_14.isnot(None), _tickers.c.rsi_14 != 0,
+             _tickers.c.rsi_14 <= _alerts.c.alert_value),
+        and_(_alerts.c.alert_type == AlertType.RSI_OVERBOUGHT,
+             _tickers.c.rsi_14.isnot(None), _tickers.c.rsi_14 != 0,
+             _tickers.c.rsi_14 >= _alerts.c.alert_value)
+    )
+).exists()
+
+_BATCH_ALERTED_TICKER_UPDATE = (
+    update(_tickers)
+    .where(_tickers.c.id == bindparam('b_id'))
+    .values(
+        times_alerted=_tickers.c.times_alerted + bindparam('b_count'),
+        last_alert_triggered=bindparam('b_triggered')
+    )
+)
+
 class WatchlistService:
     def __init__(self, db_session: Session):
         self.db = db_session
@@ -110,6 +169,13 @@ class WatchlistService:
             WatchlistTicker.date_added.desc()
         ).all()
     
+    def get_all_tickers_lite(self) -> List[Tuple[str, AssetType]]:
+        """Get (symbol, asset_type) for every active ticker without loading ORM objects"""
+        return self.db.execute(
+            select(WatchlistTicker.symbol, WatchlistTicker.asset_type)
+            .where(WatchlistTicker.is_active == True)
+        ).all()
+    
     def update_ticker_notes(self, symbol: str, notes: str, reason_added: str = None) -> bool:
         """Update ticker notes and reason"""
         ticker = self.get_ticker(symbol)
@@ -158,6 +224,104 @@ class WatchlistService:
         if not ticker:
             return False
         
+        self._apply_market_data(ticker, current_price, price_change_24h, price_change_percent_24h,
+                                volume_24h, market_cap, rsi_14, macd_signal)
+        self.db.commit()
+        return True
+    
+    def mark_ticker_checked(self, symbol: str) -> bool:
+        """Record a check whose market data was unchanged: bump date_last_checked and run alerts"""
+        ticker = self.get_ticker(symbol)
+        if not ticker:
+            return False
+        
+        ticker.date_last_checked = datetime.utcnow()
+        self._check_alerts_for_ticker(ticker)
+        self.db.commit()
+        return True
+    
+    def update_tickers_batch(self, updates: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """Apply many market data updates in a single transaction
+        
+        Each update holds update_ticker_market_data's keyword arguments, including symbol.
+        Returns symbol -> whether an active ticker was found and updated.
+        """
+        if not updates:
+            return {}
+        
+        symbols = [item['symbol'].upper() for item in updates]
+        rows = {
+            row.symbol: row
+            for row in self.db.execute(
+                select(_tickers.c.id, _tickers.c.symbol, _tickers.c.entry_price_target,
+                       _tickers.c.exit_price_target, _tickers.c.stop_loss,
+                       _tickers.c.has_active_alerts)
+                .where(and_(_tickers.c.symbol.in_(symbols), _tickers.c.is_active == True))
+            )
+        }
+        
+        now = datetime.utcnow()
+        results = {}
+        ticker_params = []
+        history_params = []
+        alert_ticker_prices: Dict[int, float] = {}
+        for item in updates:
+            symbol = item['symbol']
+            row = rows.get(symbol.upper())
+            if row is None:
+                results[symbol] = False
+                continue
+            
+            price = item['current_price']
+            ticker_params.append({
+                'b_id': row.id,
+                'b_price': price,
+                'b_change': item.get('price_change_24h'),
+                'b_change_percent': item.get('price_change_percent_24h'),
+                'b_volume': item.get('volume_24h'),
+                'b_market_cap': item.get('market_cap'),
+                'b_rsi': item.get('rsi_14'),
+                'b_macd': item.get('macd_signal'),
+                'b_checked': now
+            })
+            distance_to_entry, distance_to_exit, distance_to_stop = self._target_distances(
+                price, row.entry_price_target, row.exit_price_target, row.stop_loss
+            )
+            history_params.append({
+                'ticker_id': row.id,
+                'symbol': row.symbol,
+                'price': price,
+                'volume': item.get('volume_24h'),
+                'rsi_14': item.get('rsi_14'),
+                'distance_to_entry': distance_to_entry,
+                'distance_to_exit': distance_to_exit,
+                'distance_to_stop': distance_to_stop,
+                'date_recorded': now
+            })
+            if row.has_active_alerts:
+                alert_ticker_prices[row.id] = price
+            results[symbol] = True
+        
+        if ticker_params:
+            self.db.execute(_BATCH_MARKET_DATA_UPDATE, ticker_params)
+            self.db.execute(insert(WatchlistHistory.__table__), history_params)
+        
+        if alert_ticker_prices:
+            self._trigger_alerts_batch(alert_ticker_prices, now)
+        
+        self.db.commit()
+        return results
+    
+    def _apply_market_data(self,
+                           ticker: WatchlistTicker,
+                           current_price: float,
+                           price_change_24h: float = None,
+                           price_change_percent_24h: float = None,
+                           volume_24h: float = None,
+                           market_cap: float = None,
+                           rsi_14: float = None,
+                           macd_signal: str = None):
+        """Stage a market data update, its history row and any triggered alerts; the caller commits"""
         # Update price tracking
         if ticker.max_price_since_added is None or current_price > ticker.max_price_since_added:
             ticker.max_price_since_added = current_price
@@ -174,31 +338,17 @@ class WatchlistService:
         ticker.macd_signal = macd_signal
         ticker.date_last_checked = datetime.utcnow()
         
-        self.db.commit()
-        
         # Record historical data point
         self._record_historical_data(ticker)
         
         # Check alerts
         self._check_alerts_for_ticker(ticker)
-        
-        return True
     
     def _record_historical_data(self, ticker: WatchlistTicker):
         """Record a historical data point"""
-        # Calculate distances to targets
-        distance_to_entry = None
-        distance_to_exit = None
-        distance_to_stop = None
-        
-        if ticker.current_price and ticker.entry_price_target:
-            distance_to_entry = ((ticker.current_price - ticker.entry_price_target) / ticker.entry_price_target) * 100
-            
-        if ticker.current_price and ticker.exit_price_target:
-            distance_to_exit = ((ticker.exit_price_target - ticker.current_price) / ticker.current_price) * 100
-            
-        if ticker.current_price and ticker.stop_loss:
-            distance_to_stop = ((ticker.current_price - ticker.stop_loss) / ticker.stop_loss) * 100
+        distance_to_entry, distance_to_exit, distance_to_stop = self._target_distances(
+            ticker.current_price, ticker.entry_price_target, ticker.exit_price_target, ticker.stop_loss
+        )
         
         history_entry = WatchlistHistory(
             ticker_id=ticker.id,
@@ -212,7 +362,27 @@ class WatchlistService:
         )
         
         self.db.add(history_entry)
-        self.db.commit()
+    
+    @staticmethod
+    def _target_distances(current_price: Optional[float],
+                          entry_price_target: Optional[float],
+                          exit_price_target: Optional[float],
+                          stop_loss: Optional[float]):
+        """Percent distances from the current price to the entry, exit and stop targets"""
+        distance_to_entry = None
+        distance_to_exit = None
+        distance_to_stop = None
+        
+        if current_price and entry_price_target:
+            distance_to_entry = ((current_price - entry_price_target) / entry_price_target) * 100
+            
+        if current_price and exit_price_target:
+            distance_to_exit = ((exit_price_target - current_price) / current_price) * 100
+            
+        if current_price and stop_loss:
+            distance_to_stop = ((current_price - stop_loss) / stop_loss) * 100
+        
+        return distance_to_entry, distance_to_exit, distance_to_stop
     
     # Alert Management
     def add_alert(self, 
@@ -275,12 +445,57 @@ class WatchlistService:
                  WatchlistAlert.is_active == True)
         ).all()
     
-    def _check_alerts_for_ticker(self, ticker: WatchlistTicker):
-        """Check and trigger alerts for a ticker"""
+    def _trigger_alerts_batch(self, ticker_prices: Dict[int, float], now: datetime):
+        """Trigger every matching active alert of the given tickers (id -> new price) in one UPDATE
+        
+        Runs after the batch price update so the comparison sees the new prices;
+        only the triggered rows come back to Python.
+        """
+        triggered = self.db.execute(
+            update(_alerts)
+            .where(and_(_alerts.c.ticker_id.in_(list(ticker_prices)),
+                        _alerts.c.is_active == True,
+                        _ALERT_TRIGGERED))
+            .values(date_triggered=now, times_triggered=_alerts.c.times_triggered + 1)
+            .returning(_alerts.c.ticker_id, _alerts.c.symbol, _alerts.c.alert_type)
+        ).all()
+        if not triggered:
+            return
+        
+        counts: Dict[int, int] = {}
+        for alert in triggered:
+            counts[alert.ticker_id] = counts.get(alert.ticker_id, 0) + 1
+            # For now, just mark as triggered. Later you can add notification logic
+            print(f"🚨 ALERT TRIGGERED: {alert.symbol} - {alert.alert_type.value} at {ticker_prices[alert.ticker_id]}")
+        
+        self.db.execute(
+            _BATCH_ALERTED_TICKER_UPDATE,
+            [{'b_id': ticker_id, 'b_count': count, 'b_triggered': now} for ticker_id, count in counts.items()]
+        )
+    
+    def _get_active_alerts_by_ticker(self, ticker_ids: List[int]) -> Dict[int, List[WatchlistAlert]]:
+        """Get active alerts for many tickers in one query, grouped by ticker id"""
+        alerts_by_ticker: Dict[int, List[WatchlistAlert]] = {}
+        for alert in self.db.query(WatchlistAlert).filter(
+            and_(WatchlistAlert.ticker_id.in_(ticker_ids),
+                 WatchlistAlert.is_active == True)
+        ):
+            alerts_by_ticker.setdefault(alert.ticker_id, []).append(alert)
+        return alerts_by_ticker
+    
+    def _check_alerts_for_ticker(self, ticker: WatchlistTicker, alerts: Optional[List[WatchlistAlert]] = None):
+        """Check and trigger alerts for a ticker
+        
+        Pass alerts when they were already loaded; otherwise they are queried only
+        if the ticker is flagged as having active alerts.
+        """
         if not ticker.current_price:
             return
         
-        alerts = self.get_alerts_for_ticker(ticker.symbol)
+        if alerts is None:
+            if not ticker.has_active_alerts:
+                return
+            alerts = self._get_active_alerts_by_ticker([ticker.id]).get(ticker.id, [])
         
         for alert in alerts:
             triggered = False
@@ -303,8 +518,6 @@ class WatchlistService:
                 
                 # For now, just mark as triggered. Later you can add notification logic
                 print(f"🚨 ALERT TRIGGERED: {ticker.symbol} - {alert.alert_type.value} at {ticker.current_price}")
-                
-        self.db.commit()
     
     # Analytics and Reporting
     def get_watchlist_summary(self) -> Dict[str, Any]:
@@ -321,19 +534,15 @@ class WatchlistService:
                  WatchlistTicker.has_active_alerts == True)
         ).count()
         
-        # Get tickers that hit entry targets (within 5%)
-        near_entry_targets = self.db.query(WatchlistTicker).filter(
+        # Get tickers that hit entry targets (within 5%), counted in the database
+        near_entry_count = self.db.query(WatchlistTicker).filter(
             and_(WatchlistTicker.is_active == True,
                  WatchlistTicker.current_price.isnot(None),
-                 WatchlistTicker.entry_price_target.isnot(None))
-        ).all()
-        
-        near_entry_count = 0
-        for ticker in near_entry_targets:
-            if ticker.current_price and ticker.entry_price_target:
-                diff_percent = abs((ticker.current_price - ticker.entry_price_target) / ticker.entry_price_target) * 100
-                if diff_percent <= 5:  # Within 5%
-                    near_entry_count += 1
+                 WatchlistTicker.current_price != 0,
+                 WatchlistTicker.entry_price_target.isnot(None),
+                 WatchlistTicker.entry_price_target != 0,
+                 self._within_percent(WatchlistTicker.entry_price_target, 5))
+        ).count()
         
         return {
             'total_tickers': total_tickers,
@@ -343,6 +552,11 @@ class WatchlistService:
             'last_updated': datetime.utcnow().isoformat()
         }
     
+    @staticmethod
+    def _within_percent(target_column, threshold_percent: float):
+        """SQL condition: current price is within threshold_percent of target_column"""
+        return func.abs((WatchlistTicker.current_price - target_column) / target_column) * 100 <= threshold_percent
+    
     def get_top_movers(self, limit: int = 10) -> List[WatchlistTicker]:
         """Get the biggest movers in the watchlist"""
         return self.db.query(WatchlistTicker).filter(
@@ -354,9 +568,14 @@ class WatchlistService:
     
     def get_tickers_near_targets(self, threshold_percent: float = 5) -> List[Dict[str, Any]]:
         """Get tickers that are near their entry/exit targets"""
+        # Only rows near a target leave the database; distances are recomputed below for the response
         tickers = self.db.query(WatchlistTicker).filter(
             and_(WatchlistTicker.is_active == True,
-                 WatchlistTicker.current_price.isnot(None))
+                 WatchlistTicker.current_price.isnot(None),
+                 or_(and_(WatchlistTicker.entry_price_target != 0,
+                          self._within_percent(WatchlistTicker.entry_price_target, threshold_percent)),
+                     and_(WatchlistTicker.exit_price_target != 0,
+                          self._within_percent(WatchlistTicker.exit_price_target, threshold_percent))))
         ).all()
         
         near_targets = []
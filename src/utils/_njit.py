@@ -0,0 +1,17 @@
+"""Optional Numba JIT for numeric hot loops
+
+`njit` is numba.njit when numba is installed, otherwise a no-op decorator,
+so decorated functions still run as plain Python/NumPy.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit supporting both @njit and @njit(...)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
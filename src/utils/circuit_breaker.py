@@ -0,0 +1,44 @@
+import time
+from typing import Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because its circuit is open"""
+
+
+class CircuitBreaker:
+    """Stop calling a failing dependency for a while after repeated failures
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    `allow_request` returns False. Once `reset_timeout` seconds have passed,
+    requests are let through again; one success closes the circuit, another
+    failure re-opens it for a further `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while failing requests should be short-circuited"""
+        if self.opened_at is None:
+            return False
+        return time.monotonic() - self.opened_at < self.reset_timeout
+
+    def allow_request(self) -> bool:
+        """Whether a request may be attempted now"""
+        return not self.is_open
+
+    def record_success(self):
+        """Close the circuit and clear the failure count"""
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        """Count a failure, opening the circuit once the threshold is reached"""
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
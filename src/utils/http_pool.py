@@ -0,0 +1,37 @@
+from typing import Optional
+
+import aiohttp
+
+
+# One TCP pool and DNS cache for every long-lived aiohttp session in the process
+_connector: Optional[aiohttp.TCPConnector] = None
+
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """Get the process-wide connector, creating it on first use
+
+    Sessions built on it must pass connector_owner=False so closing a
+    session leaves the pool open for the others.
+    """
+    global _connector
+    if _connector is None or _connector.closed:
+        # Idle connections and DNS entries outlive the scheduler interval, so each
+        # refresh reuses warm TLS connections instead of re-resolving and re-handshaking
+        _connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=30,
+            use_dns_cache=True,
+            ttl_dns_cache=600,
+            keepalive_timeout=300,
+            enable_cleanup_closed=True,
+            force_close=False
+        )
+    return _connector
+
+
+async def close_shared_connector():
+    """Close the shared connector at shutdown"""
+    global _connector
+    if _connector is not None and not _connector.closed:
+        await _connector.close()
+    _connector = None
@@ -1,46 +1,36 @@
 import asyncio
 import time
-from typing import Dict, List
-from datetime import datetime, timedelta
+from typing import Dict
 
 
 class RateLimiter:
+    """Token bucket refilled at requests_per_minute, holding at most burst_limit tokens"""
+    
     def __init__(self, requests_per_minute: int = 60, burst_limit: int = 10):
         self.requests_per_minute = requests_per_minute
         self.burst_limit = burst_limit
-        self.requests = []
-        self.burst_count = 0
-        self.last_reset = datetime.now()
+        self.rate = requests_per_minute / 60  # tokens per second
+        # Never burst past the per-minute budget
+        self.capacity = min(burst_limit, requests_per_minute)
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        # Serializes callers so concurrent coroutines can't spend the same token
+        self._lock = asyncio.Lock()
     
     async def wait(self):
         """Wait if necessary to respect rate limits"""
-        now = datetime.now()
-        
-        # Reset burst counter every minute
-        if now - self.last_reset > timedelta(minutes=1):
-            self.burst_count = 0
-            self.last_reset = now
-        
-        # Remove old requests (older than 1 minute)
-        cutoff_time = now - timedelta(minutes=1)
-        self.requests = [req_time for req_time in self.requests if req_time > cutoff_time]
-        
-        # Check if we need to wait
-        if len(self.requests) >= self.requests_per_minute:
-            # Wait until the oldest request is more than 1 minute old
-            oldest_request = min(self.requests)
-            wait_time = 60 - (now - oldest_request).total_seconds()
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-        
-        # Check burst limit
-        if self.burst_count >= self.burst_limit:
-            await asyncio.sleep(1)  # Wait 1 second between bursts
-            self.burst_count = 0
-        
-        # Record this request
-        self.requests.append(now)
-        self.burst_count += 1
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            
+            if self.tokens < 1:
+                # Sleep off the deficit; the token that accrues meanwhile is spent on this request
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 0.0
+                self.last_refill = time.monotonic()
+            else:
+                self.tokens -= 1
 
 
 class GlobalRateLimiter:
@@ -1,15 +1,55 @@
 #!/usr/bin/env python3
 """Start the API server"""
+import argparse
+import os
+import shutil
+import sys
+
 import uvicorn
-from src.api.main import app
+
+APP = "src.api.main:app"
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Start the API server")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes (default: 1). Watchlist scan results live in each "
+                             "process's memory, so with more than one worker /scan results reach "
+                             "/status, /alerts and the summary endpoints only on the worker that ran it")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind")
+    args = parser.parse_args()
+    
     print("🚀 Starting Retail Meme Stock Analyzer API Server...")
-    print("📡 Server will be available at: http://localhost:8000")
-    print("📚 API Documentation: http://localhost:8000/docs")
+    print(f"📡 Server will be available at: http://localhost:{args.port}")
+    print(f"📚 API Documentation: http://localhost:{args.port}/docs")
     print("\n🌐 To view the dashboard:")
     print("   1. Keep this server running")
     print("   2. Open src/dashboard/simple_dashboard.html in your browser")
     print("\n⚡ Press Ctrl+C to stop the server\n")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Extra workers are opt-in: the API keeps scan results in module globals, which
+    # gunicorn workers don't share. gunicorn doesn't run on Windows, which falls back
+    # to a single uvicorn process
+    gunicorn = shutil.which("gunicorn")
+    if args.workers > 1 and gunicorn and sys.platform != "win32":
+        os.execv(gunicorn, [
+            "gunicorn", APP,
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", str(args.workers),
+            "--bind", f"0.0.0.0:{args.port}",
+            "--worker-connections", "1000",
+            "--keep-alive", "5",
+            "--log-level", "warning"
+        ])
+    
+    # Import string rather than the app object so uvicorn can spawn workers;
+    # uvloop isn't available on Windows
+    uvicorn.run(
+        APP,
+        host="0.0.0.0",
+        port=args.port,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        access_log=False,
+        log_level="warning"
+    )
\ No newline at end of file
@@ -7,10 +7,22 @@ without needing all API keys configured.
 """
 
 import asyncio
+import atexit
+import contextvars
+import functools
+import importlib
+import io
+import json
+import logging
 import sys
 import os
 import time
 from datetime import datetime
+from typing import Any, Awaitable, Dict, Optional, Tuple
+
+import aiofiles.os
+import aiohttp
+import orjson
 
 # Add the src directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
@@ -19,24 +31,139 @@ from src.core.config import settings
 from src.data_collectors.chart_image_collector import ChartImageCollector
 
 
+# Output buffer of the currently running concurrent test, if any
+_task_output: contextvars.ContextVar[Optional[io.StringIO]] = contextvars.ContextVar("_task_output", default=None)
+
+
+class _TaskOutput(io.TextIOBase):
+    """stdout stand-in that sends each concurrent test's prints to its own buffer"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        return (_task_output.get() or self._stream).write(text)
+    
+    def flush(self):
+        # StreamHandler flushes after every record; passing that on would write each
+        # line separately, so the real stream is flushed once at exit instead
+        pass
+
+
+def _buffered_stdout():
+    """stdout without per-write flushing; flushed once at exit"""
+    if not hasattr(sys.stdout, "buffer"):
+        return sys.stdout
+    return io.TextIOWrapper(sys.stdout.buffer, encoding=sys.stdout.encoding,
+                            errors="replace", write_through=False)
+
+
+# All report output goes through one logger and one buffered stream; while tests run
+# concurrently, the same stream also stands in for sys.stdout so library prints stay in order
+_stdout = _buffered_stdout()
+atexit.register(_stdout.flush)
+_report = _TaskOutput(_stdout)
+logger = logging.getLogger("rtsa.test")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_handler = logging.StreamHandler(_report)
+_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(_handler)
+
+
+async def _run_buffered(title: str, test: Awaitable[Any]) -> Tuple[str, Any]:
+    """Run a test under its section banner, returning (captured output, result)"""
+    buffer = io.StringIO()
+    _task_output.set(buffer)  # gather runs each call in its own task, so this stays task-local
+    print_section(title)
+    try:
+        result = await test
+    except Exception as e:
+        logger.info(f"❌ {title} raised: {e}")
+        result = False
+    return buffer.getvalue(), result
+
+
+# Heavy imports started on a worker thread so they don't block the event loop
+_prefetched_imports: Dict[str, asyncio.Task] = {}
+
+
+def _prefetch_import(name: str):
+    """Start importing a module in the background"""
+    if name not in _prefetched_imports and name not in sys.modules:
+        _prefetched_imports[name] = asyncio.create_task(asyncio.to_thread(importlib.import_module, name))
+
+
+async def _import(name: str):
+    """Import a module, waiting on its background import if one was started"""
+    task = _prefetched_imports.get(name)
+    if task is not None:
+        return await task
+    return importlib.import_module(name)
+
+
+# Last passing run per test, for --fast; tests listed in _FAST_TTLS are skipped while
+# their last pass is younger than the TTL (seconds)
+_TEST_CACHE_PATH = ".test_cache.json"
+_FAST_TTLS = {
+    "Dashboard File": 3600,
+    "Chart Integration": 900,
+    "Stock Analysis": 300
+}
+
+
+def _load_test_cache() -> Dict[str, Dict[str, Any]]:
+    """Read the results of earlier runs, keyed by test name"""
+    try:
+        with open(_TEST_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_test_cache(cache: Dict[str, Dict[str, Any]], results):
+    """Record this run's passing tests"""
+    now = time.time()
+    for name, result in results:
+        if result is True:
+            cache[name] = {"test": name, "result": True, "ts": now}
+    try:
+        with open(_TEST_CACHE_PATH, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        logger.info(f"⚠️  Could not write {_TEST_CACHE_PATH}: {e}")
+
+
+def _passed_recently(cache: Dict[str, Dict[str, Any]], name: str) -> bool:
+    """Whether a test passed within its --fast TTL"""
+    entry = cache.get(name)
+    ttl = _FAST_TTLS.get(name)
+    return bool(entry and ttl and entry.get("result") is True and time.time() - entry.get("ts", 0) < ttl)
+
+
+def _print_cached_pass(title: str):
+    """Report a test skipped because it passed recently"""
+    print_section(title)
+    logger.info("⚡ Passed recently - skipped (--fast)")
+
+
+_HEADER_RULE = "=" * 60
+_SECTION_RULE = "-" * 40
+
+
 def print_header(title):
     """Print a formatted header"""
-    print(f"\n{'='*60}")
-    print(f"🎯 {title}")
-    print(f"{'='*60}")
+    logger.info(f"\n{_HEADER_RULE}\n🎯 {title}\n{_HEADER_RULE}")
 
 
 def print_section(title):
     """Print a formatted section header"""
-    print(f"\n{'-'*40}")
-    print(f"📊 {title}")
-    print(f"{'-'*40}")
+    logger.info(f"\n{_SECTION_RULE}\n📊 {title}\n{_SECTION_RULE}")
 
 
-def check_api_configuration():
-    """Check which API keys are configured"""
-    print_header("API Configuration Check")
-    
+@functools.lru_cache(maxsize=1)
+def _api_key_status() -> Tuple[Tuple[str, bool], ...]:
+    """(name, configured) for each API key; settings don't change within a run"""
     api_keys = {
         "Alpha Vantage": settings.alpha_vantage_api_key,
         "Polygon": settings.polygon_api_key,
@@ -48,65 +175,79 @@ def check_api_configuration():
         "Benzinga": settings.benzinga_api_key,
         "Chart-img.com": getattr(settings, 'chart_img_api_key', None)
     }
+    return tuple((name, bool(key)) for name, key in api_keys.items())
+
+
+def check_api_configuration():
+    """Check which API keys are configured"""
+    print_header("API Configuration Check")
+    
+    api_keys = _api_key_status()
     
     configured = 0
-    for name, key in api_keys.items():
-        status = "✅ Configured" if key else "❌ Missing"
-        print(f"  {name:25s}: {status}")
-        if key:
+    for name, is_configured in api_keys:
+        status = "✅ Configured" if is_configured else "❌ Missing"
+        logger.info(f"  {name:25s}: {status}")
+        if is_configured:
             configured += 1
     
-    print(f"\n📊 {configured}/{len(api_keys)} API keys configured")
+    logger.info(f"\n📊 {configured}/{len(api_keys)} API keys configured")
     
     if configured == 0:
-        print("\n⚠️  No API keys configured - testing with mock data")
+        logger.info("\n⚠️  No API keys configured - testing with mock data")
     elif configured < 4:
-        print("\n💡 Some key APIs missing - limited functionality")
+        logger.info("\n💡 Some key APIs missing - limited functionality")
     else:
-        print("\n🎉 Good configuration for testing!")
+        logger.info("\n🎉 Good configuration for testing!")
     
     return configured
 
 
-async def test_chart_integration():
+async def test_chart_integration(session: aiohttp.ClientSession = None):
     """Test chart image generation"""
     print_header("Chart Integration Test")
     
-    chart_collector = ChartImageCollector()
+    chart_collector = ChartImageCollector(session=session)
     symbol = "TSLA"
     
     try:
-        print(f"🔄 Testing chart generation for {symbol}...")
+        logger.info(f"🔄 Testing chart generation for {symbol}...")
+        
+        # Every chart request is independent; issue them together and print once all resolve
+        alert_types = ["short_squeeze", "momentum", "breakout"]
+        basic_chart, timeframes, comprehensive, alert_charts = await asyncio.gather(
+            chart_collector.get_technical_chart(symbol),
+            chart_collector.get_multiple_timeframes(symbol),
+            chart_collector.get_comprehensive_chart_package(symbol),
+            asyncio.gather(*(chart_collector.get_alert_chart(symbol, alert_type) for alert_type in alert_types))
+        )
         
         # Test basic chart
         print_section("Basic Chart")
-        basic_chart = await chart_collector.get_technical_chart(symbol)
-        print(f"✅ Technical Chart: {basic_chart}")
+        logger.info(f"✅ Technical Chart: {basic_chart}")
         
         # Test multiple timeframes
         print_section("Multiple Timeframes")
-        timeframes = await chart_collector.get_multiple_timeframes(symbol)
         for timeframe, url in timeframes.items():
-            print(f"  📈 {timeframe:15}: {url}")
+            logger.info(f"  📈 {timeframe:15}: {url}")
         
         # Test alert charts
         print_section("Alert-Specific Charts")
-        alert_types = ["short_squeeze", "momentum", "breakout"]
-        for alert_type in alert_types:
-            alert_chart = await chart_collector.get_alert_chart(symbol, alert_type)
-            print(f"  🎯 {alert_type:15}: {alert_chart}")
+        for alert_type, alert_chart in zip(alert_types, alert_charts):
+            logger.info(f"  🎯 {alert_type:15}: {alert_chart}")
         
         # Test comprehensive package
         print_section("Comprehensive Package")
-        comprehensive = await chart_collector.get_comprehensive_chart_package(symbol)
-        print(f"✅ Generated {len(comprehensive)} chart types")
+        logger.info(f"✅ Generated {len(comprehensive)} chart types")
         
-        print(f"\n🎉 Chart integration test passed!")
+        logger.info(f"\n🎉 Chart integration test passed!")
         return True
         
     except Exception as e:
-        print(f"❌ Chart integration test failed: {e}")
+        logger.info(f"❌ Chart integration test failed: {e}")
         return False
+    finally:
+        await chart_collector.aclose()
 
 
 async def test_single_stock_analysis():
@@ -114,147 +255,205 @@ async def test_single_stock_analysis():
     print_header("Single Stock Analysis Test")
     
     try:
-        from src.core.stock_analyzer import StockAnalyzer
+        stock_analyzer = await _import("src.core.stock_analyzer")
         
-        analyzer = StockAnalyzer()
+        analyzer = stock_analyzer.StockAnalyzer()
         symbol = "TSLA"
         
-        print(f"🔄 Analyzing {symbol}...")
-        print("⏰ This may take 30-60 seconds with API calls...")
+        logger.info(f"🔄 Analyzing {symbol}...")
+        logger.info("⏰ This may take 30-60 seconds with API calls...")
         
-        start_time = time.time()
+        start = time.perf_counter()
         analysis = await analyzer.analyze_stock(symbol)
-        end_time = time.time()
+        elapsed = time.perf_counter() - start
         
         if analysis:
-            print(f"✅ Analysis completed in {end_time - start_time:.1f} seconds")
-            print(f"📊 Composite Score: {analysis.composite_score.total_score:.1f}/100")
-            print(f"🎯 Opportunity Type: {analysis.composite_score.opportunity_type}")
-            print(f"⚠️  Risk Level: {analysis.composite_score.risk_level}")
-            print(f"🚨 Alerts: {len(analysis.alerts)}")
+            logger.info(f"✅ Analysis completed in {elapsed:.3f} seconds")
+            logger.info(f"📊 Composite Score: {analysis.composite_score.total_score:.1f}/100")
+            logger.info(f"🎯 Opportunity Type: {analysis.composite_score.opportunity_type}")
+            logger.info(f"⚠️  Risk Level: {analysis.composite_score.risk_level}")
+            logger.info(f"🚨 Alerts: {len(analysis.alerts)}")
             
             # Check if charts are included
             if analysis.technical_analysis.chart_images:
-                print(f"📈 Chart Images: {len(analysis.technical_analysis.chart_images)}")
+                logger.info(f"📈 Chart Images: {len(analysis.technical_analysis.chart_images)}")
                 for chart_type in analysis.technical_analysis.chart_images.keys():
-                    print(f"    📊 {chart_type}")
+                    logger.info(f"    📊 {chart_type}")
             
-            print(f"\n🎉 Single stock analysis test passed!")
+            logger.info(f"\n🎉 Single stock analysis test passed!")
             return True
         else:
-            print(f"❌ Analysis returned None")
+            logger.info(f"❌ Analysis returned None")
             return False
             
     except Exception as e:
-        print(f"❌ Single stock analysis test failed: {e}")
+        logger.info(f"❌ Single stock analysis test failed: {e}")
         return False
 
 
-async def test_api_server():
+async def test_api_server(session: aiohttp.ClientSession):
     """Test if API server is working"""
     print_header("API Server Test")
     
+    # A refused TCP connect fails in well under a millisecond; only a listening
+    # server gets the full HTTP request and its 5s timeout
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection('127.0.0.1', 8000), timeout=0.2)
+        writer.close()
+        await writer.wait_closed()
+    except (OSError, asyncio.TimeoutError):
+        logger.info("❌ API server is not running")
+        logger.info("💡 Start it with: python main.py --server")
+        return False
+    
     try:
-        import aiohttp
-        
         # Test if server is running
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get('http://localhost:8000/status', timeout=5) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        print("✅ API server is running!")
-                        print(f"📊 Stocks in cache: {data.get('stocks_in_cache', 0)}")
-                        print(f"📋 Watchlist size: {data.get('watchlist_size', 0)}")
-                        
-                        # Show API key status
-                        api_keys = data.get('api_keys_configured', {})
-                        print(f"\n🔑 API Keys Status:")
-                        for key, status in api_keys.items():
-                            status_icon = "✅" if status else "❌"
-                            print(f"    {status_icon} {key}")
-                        
-                        return True
-                    else:
-                        print(f"❌ API server returned status {response.status}")
-                        return False
-                        
-            except asyncio.TimeoutError:
-                print("❌ API server is not responding (timeout)")
-                print("💡 Start it with: python main.py --server")
+        async with session.get('http://localhost:8000/status', timeout=5) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                logger.info("✅ API server is running!")
+                logger.info(f"📊 Stocks in cache: {data.get('stocks_in_cache', 0)}")
+                logger.info(f"📋 Watchlist size: {data.get('watchlist_size', 0)}")
+                
+                # Show API key status
+                api_keys = data.get('api_keys_configured', {})
+                logger.info(f"\n🔑 API Keys Status:")
+                for key, status in api_keys.items():
+                    status_icon = "✅" if status else "❌"
+                    logger.info(f"    {status_icon} {key}")
+                
+                return True
+            else:
+                logger.info(f"❌ API server returned status {response.status}")
                 return False
                 
-    except ImportError:
-        print("❌ aiohttp not installed for testing")
+    except asyncio.TimeoutError:
+        logger.info("❌ API server is not responding (timeout)")
+        logger.info("💡 Start it with: python main.py --server")
         return False
     except Exception as e:
-        print(f"❌ API server test failed: {e}")
-        print("💡 Start the server with: python main.py --server")
+        logger.info(f"❌ API server test failed: {e}")
+        logger.info("💡 Start the server with: python main.py --server")
         return False
 
 
-def test_dashboard_file():
+# path -> (exists, size, absolute path); each file is stat'ed once per process
+_file_info_cache: Dict[str, Tuple[bool, int, str]] = {}
+
+
+async def _file_info(path: str) -> Tuple[bool, int, str]:
+    """(exists, size, absolute path) for a file, stat'ed off the event loop"""
+    info = _file_info_cache.get(path)
+    if info is None:
+        try:
+            stat = await aiofiles.os.stat(path)
+            info = (True, stat.st_size, os.path.abspath(path))
+        except FileNotFoundError:
+            info = (False, 0, os.path.abspath(path))
+        _file_info_cache[path] = info
+    return info
+
+
+async def test_dashboard_file():
     """Test if dashboard file exists and is accessible"""
     print_header("Dashboard File Test")
     
     dashboard_path = "src/dashboard/simple_dashboard.html"
+    exists, file_size, abs_path = await _file_info(dashboard_path)
     
-    if os.path.exists(dashboard_path):
-        print(f"✅ Dashboard file exists: {dashboard_path}")
+    if exists:
+        logger.info(f"✅ Dashboard file exists: {dashboard_path}")
         
         # Get file size
-        file_size = os.path.getsize(dashboard_path)
-        print(f"📄 File size: {file_size:,} bytes")
+        logger.info(f"📄 File size: {file_size:,} bytes")
         
         # Show how to access it
-        abs_path = os.path.abspath(dashboard_path)
-        print(f"\n🌐 To open dashboard:")
-        print(f"   1. Start API server: python main.py --server")
-        print(f"   2. Open in browser: file://{abs_path}")
-        print(f"   3. Or drag the file to your browser")
+        logger.info(f"\n🌐 To open dashboard:")
+        logger.info(f"   1. Start API server: python main.py --server")
+        logger.info(f"   2. Open in browser: file://{abs_path}")
+        logger.info(f"   3. Or drag the file to your browser")
         
         return True
     else:
-        print(f"❌ Dashboard file not found: {dashboard_path}")
+        logger.info(f"❌ Dashboard file not found: {dashboard_path}")
         return False
 
 
-async def run_comprehensive_test():
-    """Run all tests"""
+async def run_comprehensive_test(fast: bool = False):
+    """Run all tests; with fast, skip tests that passed within their TTL"""
     print_header("Comprehensive System Test")
-    print(f"🕒 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"🕒 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     results = []
+    cache = _load_test_cache()
+    
+    def skip_recent(name: str) -> bool:
+        return fast and _passed_recently(cache, name)
     
     # Test 1: Configuration
     print_section("Test 1: Configuration")
     config_score = check_api_configuration()
     results.append(("Configuration", config_score > 0))
     
-    # Test 2: Chart Integration
-    print_section("Test 2: Chart Integration")
-    chart_result = await test_chart_integration()
-    results.append(("Chart Integration", chart_result))
-    
-    # Test 3: Dashboard File
-    print_section("Test 3: Dashboard File")
-    dashboard_result = test_dashboard_file()
-    results.append(("Dashboard File", dashboard_result))
-    
-    # Test 4: API Server
-    print_section("Test 4: API Server")
-    api_result = await test_api_server()
-    results.append(("API Server", api_result))
-    
-    # Test 5: Stock Analysis (only if we have some APIs)
-    if config_score > 0:
-        print_section("Test 5: Stock Analysis")
-        analysis_result = await test_single_stock_analysis()
-        results.append(("Stock Analysis", analysis_result))
-    else:
-        print_section("Test 5: Stock Analysis")
-        print("⏭️  Skipped - no API keys configured")
-        results.append(("Stock Analysis", None))
+    # The analysis stack (pandas, ML libraries) imports while the other tests run
+    if config_score > 0 and not skip_recent("Stock Analysis"):
+        _prefetch_import("src.core.stock_analyzer")
+    
+    # One connection pool for every HTTP call the tests make
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=30)
+    )
+    try:
+        # Test 2: Dashboard File
+        if skip_recent("Dashboard File"):
+            _print_cached_pass("Test 2: Dashboard File")
+            dashboard_result = True
+        else:
+            print_section("Test 2: Dashboard File")
+            dashboard_result = await test_dashboard_file()
+        results.append(("Dashboard File", dashboard_result))
+        
+        # Tests 3-5 touch separate subsystems, so they run concurrently; each one's
+        # output is buffered and printed in order once all have finished
+        tests = [
+            ("Chart Integration", "Test 3: Chart Integration", lambda: test_chart_integration(session)),
+            ("API Server", "Test 4: API Server", lambda: test_api_server(session))
+        ]
+        # Stock Analysis only if we have some APIs
+        if config_score > 0:
+            tests.append(("Stock Analysis", "Test 5: Stock Analysis", test_single_stock_analysis))
+        
+        pending = []
+        for name, title, test in tests:
+            if skip_recent(name):
+                _print_cached_pass(title)
+            else:
+                pending.append((name, title, test()))
+        
+        stdout = sys.stdout
+        sys.stdout = _report
+        try:
+            outcomes = await asyncio.gather(*(_run_buffered(title, test) for _, title, test in pending))
+        finally:
+            sys.stdout = stdout
+        
+        fresh = {}
+        for (name, _, _), (output, result) in zip(pending, outcomes):
+            _report.write(output)
+            fresh[name] = result
+        # Tests skipped by --fast count as passed
+        for name, _, _ in tests:
+            results.append((name, fresh.get(name, True)))
+        api_result = dict(results)["API Server"]
+        
+        if config_score == 0:
+            print_section("Test 5: Stock Analysis")
+            logger.info("⏭️  Skipped - no API keys configured")
+            results.append(("Stock Analysis", None))
+    finally:
+        await session.close()
+    
+    _save_test_cache(cache, results)
     
     # Summary
     print_header("Test Results Summary")
@@ -265,66 +464,66 @@ async def run_comprehensive_test():
     
     for test_name, result in results:
         if result is True:
-            print(f"✅ {test_name:20s}: PASSED")
+            logger.info(f"✅ {test_name:20s}: PASSED")
         elif result is False:
-            print(f"❌ {test_name:20s}: FAILED")
+            logger.info(f"❌ {test_name:20s}: FAILED")
         else:
-            print(f"⏭️  {test_name:20s}: SKIPPED")
+            logger.info(f"⏭️  {test_name:20s}: SKIPPED")
     
-    print(f"\n📊 Results: {passed} passed, {failed} failed, {skipped} skipped")
+    logger.info(f"\n📊 Results: {passed} passed, {failed} failed, {skipped} skipped")
     
     if failed == 0:
-        print(f"🎉 All available tests passed!")
+        logger.info(f"🎉 All available tests passed!")
     else:
-        print(f"⚠️  Some tests failed - check configuration")
+        logger.info(f"⚠️  Some tests failed - check configuration")
     
     # Next steps
     print_header("Next Steps")
     
     if not api_result:
-        print("1. 🚀 Start API server: python main.py --server")
+        logger.info("1. 🚀 Start API server: python main.py --server")
     
     if config_score == 0:
-        print("2. 🔑 Add API keys to .env file (see SETUP_GUIDE.md)")
+        logger.info("2. 🔑 Add API keys to .env file (see SETUP_GUIDE.md)")
     
     if dashboard_result:
-        print("3. 🌐 Open dashboard in browser")
+        logger.info("3. 🌐 Open dashboard in browser")
     
     if passed >= 3:
-        print("4. 🎯 Try analyzing: python main.py --symbol GME")
+        logger.info("4. 🎯 Try analyzing: python main.py --symbol GME")
     
-    print("5. 📚 See README.md for full setup instructions")
+    logger.info("5. 📚 See README.md for full setup instructions")
 
 
 def quick_demo():
     """Show a quick demo of what the system can do"""
     print_header("Quick Demo")
     
-    print("🎯 Retail Meme Stock Analyzer Demo")
-    print("\n📊 This system analyzes stocks using 5 factors:")
-    print("   1. 📱 Social Sentiment (Reddit, Twitter, StockTwits)")
-    print("   2. 📊 Technical Analysis (RSI, MACD, patterns)")
-    print("   3. 💰 Fundamental Analysis (P/E, growth, margins)")
-    print("   4. 👥 Analyst Coverage (ratings, price targets)")
-    print("   5. 🏗️  Stock Structure (short interest, float)")
-    
-    print("\n📈 Chart Integration:")
-    print("   • Technical analysis charts")
-    print("   • Pattern recognition charts")
-    print("   • Short squeeze analysis charts")
-    print("   • Alert-specific visualizations")
-    
-    print("\n🚀 How to use:")
-    print("   • CLI: python main.py --symbol GME")
-    print("   • API: python main.py --server")
-    print("   • Web: Open dashboard.html in browser")
-    
-    print("\n🔍 Example output:")
-    print("   GME - GameStop Corp.")
-    print("   🎯 Composite Score: 78.5/100")
-    print("   🏷️  Opportunity Type: short_squeeze")
-    print("   ⚠️  Risk Level: high")
-    print("   📈 Chart: https://chart-img.com/chart/GME")
+    logger.info("🎯 Retail Meme Stock Analyzer Demo")
+    logger.info("\n📊 This system analyzes stocks using 5 factors:")
+    logger.info("   1. 📱 Social Sentiment (Reddit, Twitter, StockTwits)")
+    logger.info("   2. 📊 Technical Analysis (RSI, MACD, patterns)")
+    logger.info("   3. 💰 Fundamental Analysis (P/E, growth, margins)")
+    logger.info("   4. 👥 Analyst Coverage (ratings, price targets)")
+    logger.info("   5. 🏗️  Stock Structure (short interest, float)")
+    
+    logger.info("\n📈 Chart Integration:")
+    logger.info("   • Technical analysis charts")
+    logger.info("   • Pattern recognition charts")
+    logger.info("   • Short squeeze analysis charts")
+    logger.info("   • Alert-specific visualizations")
+    
+    logger.info("\n🚀 How to use:")
+    logger.info("   • CLI: python main.py --symbol GME")
+    logger.info("   • API: python main.py --server")
+    logger.info("   • Web: Open dashboard.html in browser")
+    
+    logger.info("\n🔍 Example output:")
+    logger.info("   GME - GameStop Corp.")
+    logger.info("   🎯 Composite Score: 78.5/100")
+    logger.info("   🏷️  Opportunity Type: short_squeeze")
+    logger.info("   ⚠️  Risk Level: high")
+    logger.info("   📈 Chart: https://chart-img.com/chart/GME")
 
 
 async def main():
@@ -332,7 +531,8 @@ async def main():
     if len(sys.argv) > 1 and sys.argv[1] == "demo":
         quick_demo()
     else:
-        await run_comprehensive_test()
+        await run_comprehensive_test(fast="--fast" in sys.argv[1:])
+    logging.shutdown()
 
 
 if __name__ == "__main__":